@@ -0,0 +1,166 @@
+"""Timing benchmarks for the dish list and scheduler grid
+
+Run from the project directory:
+    python benchmarks.py [--dishes 10000] [--refreshes 200] [--startup-budget 500]
+                         [--conversions 100000]
+
+Each benchmark works against throwaway data files in a temporary
+directory, so the real dishes/schedule files are never touched. The
+script exits with status 1 when time to first paint exceeds the startup
+budget, so it can be used as a regression check.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def setup_data(dish_count, days):
+    """Write a synthetic dish library and a fully booked schedule to a temp dir"""
+    data_dir = tempfile.mkdtemp(prefix="dish-manager-bench-")
+    dishes = [
+        {
+            "name": f"Dish {i:05d}",
+            "tags": [f"tag{i % 7}", f"cuisine{i % 13}"],
+            "ingredients": ["2 cups - flour", "1 - egg"],
+            "recipe": "Mix and bake.",
+        }
+        for i in range(dish_count)
+    ]
+    with open(os.path.join(data_dir, "dishes.json"), "w") as file:
+        json.dump(dishes, file)
+
+    schedule = {}
+    start = datetime.now()
+    for day in range(days):
+        date_str = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        schedule[date_str] = {
+            "lunch": {"type": "bought", "description": f"Lunch {day}"},
+            "dinner": {
+                "type": "cook",
+                "dish_name": dishes[day % dish_count]["name"],
+                "leftover_meals": 0,
+                "leftover_id": f"dish-{day}-{date_str}",
+            },
+        }
+    with open(os.path.join(data_dir, "schedule.json"), "w") as file:
+        json.dump({"schedule": schedule}, file)
+
+    os.environ["DATA_FILE"] = os.path.join(data_dir, "dishes.json")
+    return data_dir
+
+
+def timed(label, func, repeat=1):
+    """Run func repeat times and print the mean wall time in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+    print(f"{label:<40} {elapsed:10.2f} ms")
+    return elapsed
+
+
+def bench_startup(runs, budget_ms):
+    """Time to first paint of main.py, taken from its --profile-startup report"""
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    first_paints = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, main_script, "--profile-startup"],
+                                capture_output=True, text=True, check=True)
+        for line in result.stdout.splitlines():
+            if line.startswith("first paint"):
+                first_paints.append(float(line.split()[-1].rstrip("ms")))
+        last_report = result.stdout
+
+    print(last_report, end="")
+    median = statistics.median(first_paints)
+    verdict = "ok" if median <= budget_ms else "OVER BUDGET"
+    print(f"{'first paint (median of ' + str(runs) + ')':<40} {median:10.2f} ms  "
+          f"budget {budget_ms} ms  {verdict}")
+    return median <= budget_ms
+
+
+def bench_dish_list(app, data_store, dish_count):
+    """List construction and search filtering at dish_count rows"""
+    from dish_manager import DishManager
+
+    manager = DishManager(data_store)
+    manager.resize(900, 650)
+    manager.show()
+    app.processEvents()
+
+    timed(f"load_dish_list ({dish_count} rows)", lambda: (manager.load_dish_list(), app.processEvents()), 5)
+    timed("filter keystroke", lambda: (manager.filter_input.setText("tag3"), app.processEvents(),
+                                       manager.filter_input.setText(""), app.processEvents()), 5)
+    manager.close()
+
+
+def bench_scheduler_grid(app, data_store, refreshes):
+    """Grid navigation and data reload on the scheduler view"""
+    from scheduler import Scheduler
+
+    scheduler = Scheduler(data_store)
+    scheduler.show()
+    app.processEvents()
+    view = scheduler.scheduler_view
+
+    def navigate():
+        view.next_day()
+        app.processEvents()
+        view.previous_day()
+        app.processEvents()
+
+    timed(f"next_day + previous_day (x{refreshes})", navigate, refreshes)
+    timed(f"load_grid_data (x{refreshes})", view.load_grid_data, refreshes)
+    scheduler.close()
+
+
+def bench_unit_conversions(count):
+    """Bulk unit conversion and amount folding with exact Fractions"""
+    from fractions import Fraction
+    from units import add_amounts, convert, convert_all
+
+    quantities = [Fraction(i % 37 + 1, i % 8 + 1) for i in range(count)]
+    mixed = [(quantity, ("cup", "tbsp", "tsp", "ml", "l")[i % 5]) for i, quantity in enumerate(quantities)]
+
+    timed(f"convert cup -> ml (x{count})", lambda: [convert(quantity, "cup", "ml") for quantity in quantities])
+    timed(f"convert_all cup -> ml (x{count})", lambda: convert_all(quantities, "cup", "ml"))
+    timed(f"add_amounts, 5 volume units (x{count})", lambda: add_amounts(mixed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dishes", type=int, default=10000, help="number of dishes in the library")
+    parser.add_argument("--refreshes", type=int, default=200, help="number of grid refreshes to time")
+    parser.add_argument("--startup-runs", type=int, default=5, help="number of cold starts to time")
+    parser.add_argument("--startup-budget", type=float, default=500,
+                        help="maximum median time to first paint in milliseconds")
+    parser.add_argument("--conversions", type=int, default=100000, help="number of amounts to convert")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    setup_data(args.dishes, days=30)
+
+    within_budget = bench_startup(args.startup_runs, args.startup_budget)
+
+    from PyQt6.QtWidgets import QApplication
+    from styles import apply_app_stylesheet
+    from data_store import DataStore
+
+    app = QApplication(sys.argv)
+    apply_app_stylesheet(app)
+    data_store = DataStore()
+
+    bench_dish_list(app, data_store, args.dishes)
+    bench_scheduler_grid(app, data_store, args.refreshes)
+    bench_unit_conversions(args.conversions)
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                             QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect
+from PyQt6.QtGui import QFont, QColor, QPen, QCursor
+from datetime import date, datetime, timedelta
+
+MEAL_TYPES = ("lunch", "dinner")
+
+# Background and border colours per meal type, matching the weekly grid cells
+MEAL_COLORS = {
+    "none": ("#ffffff", "#dee2e6"),
+    "cook": ("#e8f5e8", "#28a745"),
+    "leftovers": ("#fff3cd", "#ffc107"),
+    "bought": ("#e2e3e5", "#6c757d"),
+    "frozen": ("#d1ecf1", "#17a2b8"),
+}
+
+class CalendarModel(QAbstractTableModel):
+    """Weeks (rows) by weekdays (columns) over a long date range
+
+    Slots are only looked up when the view asks for a cell, so the cost of
+    scrolling depends on the rows on screen rather than the length of the
+    range. The data store caches each slot's display until it changes.
+    """
+    DateRole = Qt.ItemDataRole.UserRole
+    MealsRole = Qt.ItemDataRole.UserRole + 1
+
+    # Weeks appended each time the view scrolls to the end of the range
+    FETCH_WEEKS = 26
+    MAX_WEEKS = 520
+
+    def __init__(self, data_store, history_weeks=52, future_weeks=52, parent=None):
+        super().__init__(parent)
+        self.data_store = data_store
+        today = date.today()
+        self.start_date = today - timedelta(days=today.weekday(), weeks=history_weeks)
+        self.week_count = history_weeks + future_weeks + 1
+
+        self.data_store.slot_changed.connect(self.on_slot_changed)
+        self.data_store.recurring_changed.connect(self.on_recurring_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.week_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 7
+
+    def date_at(self, row, column):
+        """Return the date shown in a cell"""
+        return self.start_date + timedelta(days=row * 7 + column)
+
+    def index_for_date(self, day):
+        """Return the cell index for a date, or an invalid index when out of range"""
+        offset = (day - self.start_date).days
+        if 0 <= offset < self.week_count * 7:
+            return self.index(offset // 7, offset % 7)
+        return QModelIndex()
+
+    def day_meals(self, date_str):
+        """Return ((display_type, text), ...) for lunch and dinner on a day"""
+        return tuple(self.data_store.meal_display(date_str, meal_type) for meal_type in MEAL_TYPES)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        day = self.date_at(index.row(), index.column())
+        if role == self.DateRole:
+            return day
+        if role == self.MealsRole:
+            return self.day_meals(day.strftime("%Y-%m-%d"))
+        if role == Qt.ItemDataRole.ToolTipRole:
+            meals = self.day_meals(day.strftime("%Y-%m-%d"))
+            lines = [day.strftime("%A, %B %d, %Y")]
+            for meal_type, (_, text) in zip(MEAL_TYPES, meals):
+                lines.append(f"{meal_type.capitalize()}: {(text or '').replace(chr(10), ' ')}")
+            return "\n".join(lines)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.date_at(0, section).strftime("%A")
+        return None
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.week_count < self.MAX_WEEKS
+
+    def fetchMore(self, parent):
+        """Extend the range further into the future"""
+        count = min(self.FETCH_WEEKS, self.MAX_WEEKS - self.week_count)
+        self.beginInsertRows(QModelIndex(), self.week_count, self.week_count + count - 1)
+        self.week_count += count
+        self.endInsertRows()
+
+    def on_slot_changed(self, date_str, meal_type):
+        """Repaint the cell for a changed slot if it is in range"""
+        index = self.index_for_date(datetime.strptime(date_str, "%Y-%m-%d").date())
+        if index.isValid():
+            self.dataChanged.emit(index, index, [self.MealsRole])
+
+    def on_recurring_changed(self):
+        """Repaint every cell; only the visible ones are looked up again"""
+        if self.week_count:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.week_count - 1, 6), [self.MealsRole])
+
+class CalendarDayDelegate(QStyledItemDelegate):
+    """Paints one calendar day: the date followed by a lunch and a dinner strip"""
+    HEADER_HEIGHT = 18
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # In compact (quarter) mode the strips only show the meal colour
+        self.compact = False
+
+        self.day_font = QFont()
+        self.day_font.setPixelSize(12)
+        self.day_font.setWeight(QFont.Weight.DemiBold)
+        self.meal_font = QFont()
+        self.meal_font.setPixelSize(11)
+
+        self.text_color = QColor("#2c3e50")
+        self.muted_color = QColor("#6c757d")
+        self.today_color = QColor("#3498db")
+        self.cell_border = QColor("#dee2e6")
+        self.past_background = QColor("#f8f9fa")
+        self.day_background = QColor("white")
+        self.meal_colors = {meal_type: (QColor(background), QColor(border))
+                            for meal_type, (background, border) in MEAL_COLORS.items()}
+
+    def meal_rects(self, rect):
+        """Return the lunch and dinner strip rectangles inside a cell rectangle"""
+        body = rect.adjusted(4, self.HEADER_HEIGHT + 2, -4, -4)
+        half = max(body.height() // 2, 1)
+        lunch = QRect(body.left(), body.top(), body.width(), half - 1)
+        dinner = QRect(body.left(), body.top() + half + 1, body.width(), body.height() - half - 1)
+        return lunch, dinner
+
+    def paint(self, painter, option, index):
+        day = index.data(CalendarModel.DateRole)
+        meals = index.data(CalendarModel.MealsRole)
+        today = date.today()
+        rect = option.rect.adjusted(1, 1, -1, -1)
+
+        painter.save()
+
+        # Cell background and border
+        painter.setPen(QPen(self.today_color if day == today else self.cell_border))
+        painter.setBrush(self.past_background if day < today else self.day_background)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        # Date line; the first of each month also names the month
+        label = day.strftime("%b %d") if day.day == 1 else str(day.day)
+        painter.setFont(self.day_font)
+        painter.setPen(self.today_color if day == today else self.text_color)
+        header_rect = QRect(rect.left() + 6, rect.top() + 2, rect.width() - 12, self.HEADER_HEIGHT)
+        painter.drawText(header_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+
+        # Lunch and dinner strips
+        painter.setFont(self.meal_font)
+        metrics = painter.fontMetrics()
+        for (display_type, text), strip in zip(meals, self.meal_rects(rect)):
+            background, border = self.meal_colors.get(display_type or "none", self.meal_colors["none"])
+            painter.setPen(border)
+            painter.setBrush(background)
+            painter.drawRect(strip.adjusted(0, 0, -1, -1))
+            if self.compact or display_type in (None, "none"):
+                continue
+            painter.setPen(self.muted_color)
+            text_rect = strip.adjusted(4, 0, -4, 0)
+            elided = metrics.elidedText(text.split("\n")[0], Qt.TextElideMode.ElideRight, text_rect.width())
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+
+        painter.restore()
+
+class CalendarView(QWidget):
+    """Scrollable month/quarter calendar of the whole schedule"""
+    MONTH_ROW_HEIGHT = 96
+    QUARTER_ROW_HEIGHT = 44
+
+    def __init__(self, data_store, scheduler_parent=None):
+        super().__init__()
+        self.data_store = data_store
+        self.scheduler_parent = scheduler_parent
+        self.scrolled_to_today = False
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the calendar UI"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(20)
+
+        # Header
+        header_layout = QHBoxLayout()
+
+        back_button = QPushButton("← Back to Week View")
+        back_button.setProperty("class", "secondary")
+        back_button.clicked.connect(self.back_to_week_view)
+        header_layout.addWidget(back_button)
+
+        header_layout.addStretch()
+
+        self.month_label = QLabel()
+        self.month_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.month_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50; margin: 0 20px;")
+        header_layout.addWidget(self.month_label)
+
+        header_layout.addStretch()
+
+        today_button = QPushButton("Today")
+        today_button.clicked.connect(self.scroll_to_today)
+        header_layout.addWidget(today_button)
+
+        self.zoom_button = QPushButton("Quarter View")
+        self.zoom_button.setProperty("class", "secondary")
+        self.zoom_button.clicked.connect(self.toggle_zoom)
+        header_layout.addWidget(self.zoom_button)
+
+        layout.addLayout(header_layout)
+
+        # Calendar table; only the rows on screen are ever painted or looked up
+        self.model = CalendarModel(self.data_store, parent=self)
+        self.delegate = CalendarDayDelegate(self)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(self.delegate)
+        self.table.setShowGrid(False)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.MONTH_ROW_HEIGHT)
+        self.table.verticalScrollBar().valueChanged.connect(self.update_month_label)
+        self.table.doubleClicked.connect(self.edit_slot)
+        layout.addWidget(self.table)
+
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Geometry is only known once shown, so the first scroll waits until then
+        if not self.scrolled_to_today:
+            self.scrolled_to_today = True
+            self.scroll_to_today()
+
+    def scroll_to_today(self):
+        """Scroll so the current week is at the top"""
+        self.scroll_to_date(date.today())
+
+    def scroll_to_date(self, day):
+        """Scroll so the week containing day is at the top"""
+        index = self.model.index_for_date(day)
+        if index.isValid():
+            self.table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
+        self.update_month_label()
+
+    def top_visible_date(self):
+        """Return the Monday of the first week on screen"""
+        row = self.table.rowAt(0)
+        return self.model.date_at(max(row, 0), 0)
+
+    def update_month_label(self):
+        """Show the month of the first week on screen, judged by its Thursday"""
+        row = max(self.table.rowAt(0), 0)
+        self.month_label.setText(self.model.date_at(row, 3).strftime("%B %Y"))
+
+    def toggle_zoom(self):
+        """Switch between month rows and compact quarter rows, keeping the top week"""
+        top_date = self.top_visible_date()
+        self.delegate.compact = not self.delegate.compact
+        if self.delegate.compact:
+            self.zoom_button.setText("Month View")
+            self.table.verticalHeader().setDefaultSectionSize(self.QUARTER_ROW_HEIGHT)
+        else:
+            self.zoom_button.setText("Quarter View")
+            self.table.verticalHeader().setDefaultSectionSize(self.MONTH_ROW_HEIGHT)
+        self.scroll_to_date(top_date)
+
+    def edit_slot(self, index):
+        """Open the meal planner for the lunch or dinner strip that was double-clicked"""
+        position = self.table.viewport().mapFromGlobal(QCursor.pos())
+        lunch_rect, _ = self.delegate.meal_rects(self.table.visualRect(index))
+        meal_type = "lunch" if position.y() <= lunch_rect.bottom() else "dinner"
+
+        date_str = index.data(CalendarModel.DateRole).strftime("%Y-%m-%d")
+        if self.scheduler_parent:
+            self.scheduler_parent.show_meal_planning_view(
+                date_str, meal_type, self.data_store.get_meal(date_str, meal_type))
+
+    def back_to_week_view(self):
+        """Return to the weekly grid"""
+        if self.scheduler_parent:
+            self.scheduler_parent.show_week_view()
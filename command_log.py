@@ -0,0 +1,155 @@
+"""Undo/redo history for schedule, recurring-rule and dish edits
+
+Every edit committed through the data store is recorded as a command that
+holds only what it changed (the before and after of each touched slot, or the
+dishes added, replaced or removed). Undo and redo replay those deltas through
+the data store, so the usual save and change signals follow; no file is ever
+snapshotted. The history is a ring buffer of the last LIMIT commands.
+"""
+from collections import deque
+from contextlib import contextmanager
+
+LIMIT = 100
+
+class SlotEdit:
+    """Schedule slots before and after an edit; None is an empty slot"""
+    def __init__(self, label, before, after):
+        self.label = label
+        self.before = before
+        self.after = after
+
+    def undo(self, data_store):
+        data_store.restore_slots(self.before)
+
+    def redo(self, data_store):
+        data_store.restore_slots(self.after)
+
+class RulesEdit:
+    """The recurring rule list before and after an edit"""
+    def __init__(self, label, before, after):
+        self.label = label
+        # Rules are edited in place (end_date), so these must be copies
+        self.before = before
+        self.after = after
+
+    def undo(self, data_store):
+        data_store.restore_rules(self.before)
+
+    def redo(self, data_store):
+        data_store.restore_rules(self.after)
+
+class DishAdd:
+    def __init__(self, index, dish):
+        self.label = f"Add {dish.get('name', 'dish')}"
+        self.index = index
+        self.dish = dish
+
+    def undo(self, data_store):
+        data_store.remove_dishes([self.dish])
+
+    def redo(self, data_store):
+        data_store.insert_dishes([(self.index, self.dish)])
+
+class DishUpdate:
+    def __init__(self, old_dish, new_dish):
+        self.label = f"Edit {new_dish.get('name', 'dish')}"
+        self.old_dish = old_dish
+        self.new_dish = new_dish
+
+    def undo(self, data_store):
+        data_store.update_dish(self.new_dish, self.old_dish)
+
+    def redo(self, data_store):
+        data_store.update_dish(self.old_dish, self.new_dish)
+
+class DishRemove:
+    """Removed dishes with the positions they had in the library"""
+    def __init__(self, indexed_dishes):
+        self.label = f"Remove {len(indexed_dishes)} dish(es)"
+        self.indexed_dishes = indexed_dishes
+
+    def undo(self, data_store):
+        data_store.insert_dishes(self.indexed_dishes)
+
+    def redo(self, data_store):
+        data_store.remove_dishes([dish for _, dish in self.indexed_dishes])
+
+class CommandGroup:
+    """Several commands undone and redone as one step"""
+    def __init__(self, label):
+        self.label = label
+        self.commands = []
+
+    def undo(self, data_store):
+        for command in reversed(self.commands):
+            command.undo(data_store)
+
+    def redo(self, data_store):
+        for command in self.commands:
+            command.redo(data_store)
+
+class CommandLog:
+    """Bounded undo and redo stacks
+
+    Recording a new command clears the redo stack. Commands recorded while
+    a group is open are collected into that group, and nothing is recorded
+    while a command is being undone or redone.
+    """
+    def __init__(self, limit=LIMIT):
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = deque(maxlen=limit)
+        self.open_group = None
+        self.replaying = False
+
+    def record(self, command):
+        if self.replaying:
+            return
+        if self.open_group is not None:
+            self.open_group.commands.append(command)
+            return
+        self.undo_stack.append(command)
+        self.redo_stack.clear()
+
+    @contextmanager
+    def group(self, label):
+        """Record everything done in the block as one undo step"""
+        if self.open_group is not None:
+            # Nested groups fold into the outer one
+            yield
+            return
+        self.open_group = CommandGroup(label)
+        try:
+            yield
+        finally:
+            group, self.open_group = self.open_group, None
+            if group.commands:
+                self.record(group)
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self, data_store):
+        """Undo the latest command; returns its label, or None if there is none"""
+        return self._replay(self.undo_stack, self.redo_stack, data_store, "undo")
+
+    def redo(self, data_store):
+        """Redo the latest undone command; returns its label, or None if there is none"""
+        return self._replay(self.redo_stack, self.undo_stack, data_store, "redo")
+
+    def _replay(self, source, target, data_store, method):
+        if not source:
+            return None
+        command = source.pop()
+        self.replaying = True
+        try:
+            getattr(command, method)(data_store)
+        except Exception:
+            source.append(command)
+            raise
+        finally:
+            self.replaying = False
+        target.append(command)
+        return command.label
@@ -0,0 +1,643 @@
+import copy
+import threading
+from datetime import datetime, timedelta
+from PyQt6.QtCore import QObject, QThread, QTimer, QCoreApplication, pyqtSignal
+# The indexes, parsers and undo commands are imported where they are first
+# used, so importing the store costs little before the first window is painted
+from utilities import (load_dishes, save_dishes, load_schedule, save_schedule,
+                       load_ingredient_tracking, save_ingredient_tracking, cleanup_old_ingredient_data,
+                       describe_meal)
+
+# Checklist ticks are written this long after the last one, in one batch
+TRACKING_SAVE_DELAY_MS = 1000
+
+class DishLoader(QObject):
+    """Reads the dish library on a worker thread and prepares sorted model rows
+
+    The parsed list is handed over through `dishes` once `parsed` is set;
+    model rows follow in name order as batches.
+    """
+    BATCH_SIZE = 500
+
+    # Dishes, their sort keys and search keys, and the total dish count
+    batch_ready = pyqtSignal(object, object, object, int)
+    finished = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.dishes = None
+        self.parsed = threading.Event()
+
+    def run(self):
+        from dish_models import DishListModel
+        try:
+            self.dishes = load_dishes()
+            self.parsed.set()
+
+            rows = sorted(self.dishes, key=DishListModel.collation_key)
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                batch = rows[start:start + self.BATCH_SIZE]
+                self.batch_ready.emit(batch,
+                                      [DishListModel.collation_key(dish) for dish in batch],
+                                      [DishListModel.build_search_key(dish) for dish in batch],
+                                      len(rows))
+        except Exception:
+            # An exception escaping a thread's slot aborts the application;
+            # with no list handed over, _on_dishes_loaded reads the file again
+            self.dishes = None
+        finally:
+            # Never leave a reader of DataStore.dishes waiting, even on failure
+            self.parsed.set()
+            self.finished.emit()
+
+class ScheduleError(ValueError):
+    """A schedule transaction would leave the schedule inconsistent"""
+
+class ScheduleTransaction:
+    """A batch of schedule edits that is validated and saved once
+
+    Edits apply to the store's schedule_data straight away, so later steps in
+    the batch see them. commit() checks the leftover chains the batch touched,
+    saves once and announces every changed slot; rollback() puts the touched
+    slots back. Used as a context manager it commits on success and rolls
+    back if the block raises. A committed batch becomes one undo step.
+    """
+    def __init__(self, data_store, label="Edit schedule"):
+        self.data_store = data_store
+        self.label = label
+        # Slot -> meal data before this transaction (None if the slot was empty)
+        self.originals = {}
+        self.active = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.rollback()
+        elif self.active:
+            self.commit()
+        return False
+
+    @property
+    def changed_slots(self):
+        return set(self.originals)
+
+    def get_slot(self, date, meal_type):
+        """Return the meal currently in a slot, including edits made in this batch"""
+        return self.data_store.get_meal(date, meal_type)
+
+    def set_slot(self, date, meal_type, meal_data):
+        """Put meal_data in a slot"""
+        self._remember(date, meal_type)
+        schedule = self.data_store.schedule_data.setdefault("schedule", {})
+        schedule.setdefault(date, {})[meal_type] = meal_data
+        self.data_store.sync_slots([(date, meal_type)])
+
+    def delete_slot(self, date, meal_type):
+        """Empty a slot; does nothing if it is already empty"""
+        schedule = self.data_store.schedule_data.get("schedule", {})
+        if meal_type not in schedule.get(date, {}):
+            return
+        self._remember(date, meal_type)
+        del schedule[date][meal_type]
+        if not schedule[date]:
+            del schedule[date]
+        self.data_store.sync_slots([(date, meal_type)])
+
+    def delete_leftover_chain(self, leftover_id):
+        """Empty every leftovers slot that belongs to leftover_id"""
+        for date, meal_type in self.data_store.leftover_chains.chain(leftover_id):
+            self.delete_slot(date, meal_type)
+
+    def validate(self):
+        """Raise ScheduleError if the batch broke a leftover chain
+
+        Every leftovers slot written in this batch must point at a cooked meal
+        in an earlier slot, and a cooked meal removed or replaced in this
+        batch must not leave its leftovers behind.
+        """
+        from slot_allocator import slot_number
+        chains = self.data_store.leftover_chains
+        for (date, meal_type), original in self.originals.items():
+            meal_data = self.data_store.get_scheduled_meal(date, meal_type)
+            if meal_data and meal_data.get("type") == "leftovers":
+                cook_slot = chains.cooks.get(meal_data.get("leftover_id"))
+                if cook_slot is None or slot_number(*cook_slot) >= slot_number(date, meal_type):
+                    raise ScheduleError(f"Leftovers on {date} {meal_type} have no cooked meal before them")
+            if original and original.get("type") == "cook":
+                leftover_id = original.get("leftover_id")
+                if leftover_id in chains.leftovers and leftover_id not in chains.cooks:
+                    raise ScheduleError(f"Removing the meal cooked on {date} {meal_type} would orphan its leftovers")
+
+    def commit(self, validate=True):
+        """Validate, save once and announce the changed slots; rolls back on failure"""
+        self._check_active()
+        try:
+            if validate:
+                self.validate()
+            self.data_store.commit_schedule(self.changed_slots)
+        except Exception:
+            self.rollback()
+            raise
+        self.active = False
+        if self.originals:
+            after = {slot: self.data_store.get_scheduled_meal(*slot) for slot in self.originals}
+            from command_log import SlotEdit
+            self.data_store.record_command(SlotEdit(self.label, dict(self.originals), after))
+
+    def rollback(self):
+        """Restore every slot this batch touched"""
+        if not self.active:
+            return
+        schedule = self.data_store.schedule_data.setdefault("schedule", {})
+        for (date, meal_type), original in self.originals.items():
+            if original is None:
+                day = schedule.get(date, {})
+                day.pop(meal_type, None)
+                if date in schedule and not day:
+                    del schedule[date]
+            else:
+                schedule.setdefault(date, {})[meal_type] = original
+        self.data_store.sync_slots(self.originals)
+        self.active = False
+
+    def _remember(self, date, meal_type):
+        self._check_active()
+        slot = (date, meal_type)
+        if slot not in self.originals:
+            self.originals[slot] = self.data_store.get_scheduled_meal(date, meal_type)
+
+    def _check_active(self):
+        if not self.active:
+            raise ScheduleError("This schedule transaction has already been committed or rolled back")
+
+class DataStore(QObject):
+    """Application-wide in-memory copy of dishes, schedule and ingredient tracking
+
+    Every view reads from and writes through the same store, which is the only
+    place that persists data. Views listen to the change signals instead of
+    re-reading the files.
+    """
+    # Old dish (None when added), new dish (None when removed)
+    dish_changed = pyqtSignal(object, object)
+    # Date string and meal type of a schedule slot that was set or cleared
+    slot_changed = pyqtSignal(str, str)
+    # Recurring rules were added, changed or ended; any slot may look different
+    recurring_changed = pyqtSignal()
+    tracking_changed = pyqtSignal()
+    # Rows streamed into dish_model so far and the total, while loading in the background
+    dishes_loading = pyqtSignal(int, int)
+    dishes_loaded = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Data files are read on first access (or by load()) so that creating
+        # the store costs nothing before the first window is painted
+        self._dishes = None
+        self._schedule_data = None
+        self._tracking_data = None
+        self._dish_model = None
+        self._dish_loader = None
+        self._dish_loader_thread = None
+        self._streamed_rows = 0
+        self._edited_while_loading = False
+        # (date, meal_type) -> (display_type, text), dropped when the slot changes
+        self._display_cache = {}
+        self._slot_allocator = None
+        self._recurring_rules = None
+        self._leftover_chains = None
+        self._dish_index = None
+        self._tracking_index = None
+        # Undo/redo history of edits made through the store, created on first use
+        self._command_log = None
+
+        # Ticked ingredients are kept in memory and written together once
+        # the ticking stops, or when the application quits
+        self._tracking_dirty = False
+        self._tracking_save_timer = QTimer(self)
+        self._tracking_save_timer.setSingleShot(True)
+        self._tracking_save_timer.setInterval(TRACKING_SAVE_DELAY_MS)
+        self._tracking_save_timer.timeout.connect(self.flush_tracking)
+        if QCoreApplication.instance() is not None:
+            QCoreApplication.instance().aboutToQuit.connect(self.flush_tracking)
+
+    @property
+    def dishes(self):
+        if self._dishes is None:
+            if self._dish_loader is not None:
+                # Take the worker's list rather than parsing the file a second time
+                self._dish_loader.parsed.wait()
+                self._dishes = self._dish_loader.dishes
+            if self._dishes is None:
+                self._dishes = load_dishes()
+        return self._dishes
+
+    @property
+    def schedule_data(self):
+        if self._schedule_data is None:
+            self._schedule_data = load_schedule()
+        return self._schedule_data
+
+    @property
+    def tracking_data(self):
+        if self._tracking_data is None:
+            self._tracking_data = load_ingredient_tracking()
+        return self._tracking_data
+
+    def load(self):
+        """Read any data files that have not been read yet, the dish library in the background"""
+        self.schedule_data
+        self.tracking_data
+        self.load_dishes_async()
+
+    # Dishes
+
+    @property
+    def dish_model(self):
+        """Sorted list model of the dish library, shared by every dish list and picker"""
+        if self._dish_model is None:
+            from dish_models import DishListModel
+            self._dish_model = DishListModel(self)
+            if not self.is_loading_dishes():
+                self._dish_model.set_dishes(self.dishes)
+            self.dish_changed.connect(self._dish_model.on_dish_changed)
+        return self._dish_model
+
+    def is_loading_dishes(self):
+        """True while the dish library is still streaming in from the worker thread"""
+        return self._dish_loader is not None
+
+    def load_dishes_async(self):
+        """Parse the dish library on a worker thread and stream it into dish_model in batches"""
+        if self._dishes is not None or self._dish_loader is not None:
+            return
+
+        self._dish_loader = DishLoader()
+        self._dish_loader_thread = QThread(self)
+        self._dish_loader.moveToThread(self._dish_loader_thread)
+        self._dish_loader_thread.started.connect(self._dish_loader.run)
+        self._dish_loader.batch_ready.connect(self._on_dish_batch)
+        self._dish_loader.finished.connect(self._on_dishes_loaded)
+
+        # Don't let the application exit with the worker still running
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_dish_loader)
+
+        # Create the model now so every batch lands in it
+        self.dish_model
+        self._streamed_rows = 0
+        self._edited_while_loading = False
+        self.dish_changed.connect(self._on_dish_edited_while_loading)
+        self._dish_loader_thread.start()
+
+    def _stop_dish_loader(self):
+        if self._dish_loader_thread is not None:
+            self._dish_loader_thread.quit()
+            self._dish_loader_thread.wait()
+
+    def _on_dish_batch(self, dishes, sort_keys, search_keys, total):
+        self._dish_model.append_rows(dishes, sort_keys, search_keys)
+        self._streamed_rows += len(dishes)
+        self.dishes_loading.emit(self._streamed_rows, total)
+
+    def _on_dish_edited_while_loading(self, old_dish, new_dish):
+        self._edited_while_loading = True
+
+    def _on_dishes_loaded(self):
+        self.dish_changed.disconnect(self._on_dish_edited_while_loading)
+        self._dish_loader_thread.quit()
+        self._dish_loader_thread.wait()
+        if self._dishes is None:
+            self._dishes = self._dish_loader.dishes
+        self._dish_loader_thread.deleteLater()
+        self._dish_loader = None
+        self._dish_loader_thread = None
+
+        # Rebuild if the worker failed or dishes were edited while rows were
+        # still arriving: edits (undo and redo included) insert into rows that
+        # are not fully sorted yet, so the streamed rows may be stale or out of order
+        streamed = {id(dish) for dish in self._dish_model.dishes}
+        if (self._dishes is None or self._edited_while_loading
+                or len(self._dish_model.dishes) != len(self._dishes)
+                or any(id(dish) not in streamed for dish in self._dishes)):
+            self._dish_model.set_dishes(self.dishes)
+        self._edited_while_loading = False
+        self.dishes_loaded.emit()
+
+    def find_dish(self, dish_name):
+        """Return the dish with the given name, or None
+
+        The name index is rebuilt lazily after the library changes, so
+        lookups are O(1) between edits.
+        """
+        if self._dish_index is None:
+            self._dish_index = {}
+            for dish in self.dishes:
+                self._dish_index.setdefault(dish['name'], dish)
+        return self._dish_index.get(dish_name)
+
+    def add_dish(self, dish):
+        """Add a new dish and persist the library"""
+        from ingredients import attach_parsed
+        from command_log import DishAdd
+        attach_parsed(dish)
+        self.dishes.append(dish)
+        self._dish_index = None
+        save_dishes(self.dishes)
+        self.dish_changed.emit(None, dish)
+        self.record_command(DishAdd(len(self.dishes) - 1, dish))
+
+    def insert_dishes(self, indexed_dishes):
+        """Put (index, dish) pairs back where they were and persist once; used by undo"""
+        for index, dish in sorted(indexed_dishes, key=lambda item: item[0]):
+            self.dishes.insert(index, dish)
+        self._dish_index = None
+        save_dishes(self.dishes)
+        for _, dish in indexed_dishes:
+            self.dish_changed.emit(None, dish)
+
+    def update_dish(self, old_dish, new_dish):
+        """Replace old_dish (matched by identity) with new_dish and persist"""
+        from ingredients import attach_parsed
+        from command_log import DishUpdate
+        for i, dish in enumerate(self.dishes):
+            if dish is old_dish:
+                attach_parsed(new_dish)
+                self.dishes[i] = new_dish
+                break
+        else:
+            return
+        self._dish_index = None
+        save_dishes(self.dishes)
+        self.dish_changed.emit(old_dish, new_dish)
+        self.record_command(DishUpdate(old_dish, new_dish))
+
+    def remove_dishes(self, dishes):
+        """Remove the given dishes (matched by identity) and persist once"""
+        from command_log import DishRemove
+        removed_ids = {id(dish) for dish in dishes}
+        removed = [(i, dish) for i, dish in enumerate(self.dishes) if id(dish) in removed_ids]
+        if not removed:
+            return
+        self.dishes[:] = [dish for dish in self.dishes if id(dish) not in removed_ids]
+        self._dish_index = None
+        save_dishes(self.dishes)
+        for _, dish in removed:
+            self.dish_changed.emit(dish, None)
+        self.record_command(DishRemove(removed))
+
+    # Schedule
+
+    def get_meal(self, date, meal_type):
+        """Return the meal planned for a slot, or None
+
+        A slot without an entry of its own shows the recurring rule covering it.
+        """
+        from recurring_rules import resolve_meal
+        return resolve_meal(self.schedule_data, self.recurring_rules, date, meal_type)
+
+    def get_scheduled_meal(self, date, meal_type):
+        """Return the slot's own entry, ignoring recurring rules"""
+        return self.schedule_data.get("schedule", {}).get(date, {}).get(meal_type)
+
+    def meal_display(self, date, meal_type):
+        """Return the (display_type, text) shown for a slot, computing it on first use"""
+        key = (date, meal_type)
+        display = self._display_cache.get(key)
+        if display is None:
+            display = describe_meal(self.get_meal(date, meal_type))
+            self._display_cache[key] = display
+        return display
+
+    def prefetch_displays(self, dates):
+        """Compute the lunch and dinner displays for dates ahead of them being shown"""
+        for date in dates:
+            self.meal_display(date, "lunch")
+            self.meal_display(date, "dinner")
+
+    @property
+    def slot_allocator(self):
+        """Index of occupied slots used to find free ones"""
+        if self._slot_allocator is None:
+            from slot_allocator import SlotAllocator
+            self._slot_allocator = SlotAllocator(self.schedule_data, self.recurring_rules)
+        return self._slot_allocator
+
+    @property
+    def leftover_chains(self):
+        """Index of cooked meals and their leftovers by leftover_id"""
+        if self._leftover_chains is None:
+            from leftover_reflow import LeftoverChains
+            self._leftover_chains = LeftoverChains(self.schedule_data)
+        return self._leftover_chains
+
+    @property
+    def recurring_rules(self):
+        """Index of the schedule's recurring rules"""
+        if self._recurring_rules is None:
+            from recurring_rules import RecurringRules
+            self._recurring_rules = RecurringRules(self.schedule_data)
+        return self._recurring_rules
+
+    def sync_slots(self, slots):
+        """Bring the slot indexes and display cache up to date for slots edited in place"""
+        for slot in slots:
+            self._display_cache.pop(slot, None)
+        if self._leftover_chains is not None:
+            for date, meal_type in slots:
+                self._leftover_chains.update(date, meal_type, self.get_scheduled_meal(date, meal_type))
+        if self._slot_allocator is None:
+            return
+        schedule = self.schedule_data.get("schedule", {})
+        for date, meal_type in slots:
+            if meal_type in schedule.get(date, {}):
+                self._slot_allocator.occupy(date, meal_type)
+            else:
+                self._slot_allocator.release(date, meal_type)
+
+    def begin_schedule(self, label="Edit schedule"):
+        """Start a batch of schedule edits that is validated and saved once"""
+        return ScheduleTransaction(self, label)
+
+    def commit_schedule(self, changed_slots):
+        """Persist schedule_data after in-place edits and announce the changed slots"""
+        if not changed_slots:
+            return
+        save_schedule(self.schedule_data)
+        self.sync_slots(changed_slots)
+        for date, meal_type in sorted(changed_slots):
+            self.slot_changed.emit(date, meal_type)
+
+    def check_schedule(self, repair=False):
+        """Check every leftover chain and return the issues found
+
+        With repair, the fixes are committed as one undoable batch.
+        """
+        from schedule_check import check_schedule, apply_repairs
+        issues = check_schedule(self.schedule_data)
+        if repair and issues:
+            with self.begin_schedule("Repair schedule") as transaction:
+                apply_repairs(transaction, issues)
+        return issues
+
+    def restore_slots(self, states):
+        """Put slots back to recorded meal data (None empties them) as one batch; used by undo"""
+        transaction = self.begin_schedule()
+        for (date, meal_type), meal_data in states.items():
+            if meal_data is None:
+                transaction.delete_slot(date, meal_type)
+            else:
+                transaction.set_slot(date, meal_type, meal_data)
+        # Recorded states were the schedule once, so they are not validated again
+        transaction.commit(validate=False)
+
+    def shopping_list(self, start_date, end_date):
+        """Ingredients needed for the cooked meals from start_date to end_date (see shopping_list.py)"""
+        from shopping_list import build_shopping_list
+        return build_shopping_list(self.schedule_data, self.find_dish, start_date, end_date, self.recurring_rules)
+
+    # Recurring rules
+
+    def repeat_meal(self, date, meal_type, meal_data):
+        """Repeat meal_data in this slot every week from date on
+
+        A rule already covering the slot is ended the day before, so earlier
+        weeks keep what they showed.
+        """
+        from recurring_rules import new_rule
+        before = copy.deepcopy(self.schedule_data.get("recurring", []))
+        self._end_rule_before(date, meal_type)
+        self.schedule_data.setdefault("recurring", []).append(new_rule(date, meal_type, meal_data))
+        self._commit_rules("Repeat meal", before)
+
+    def stop_repeating(self, date, meal_type):
+        """End the rule covering this slot so it no longer applies from date on"""
+        before = copy.deepcopy(self.schedule_data.get("recurring", []))
+        if self._end_rule_before(date, meal_type):
+            self._commit_rules("Stop repeating meal", before)
+
+    def restore_rules(self, rules):
+        """Replace the recurring rule list with a recorded one; used by undo"""
+        self.schedule_data["recurring"] = copy.deepcopy(rules)
+        self._commit_rules()
+
+    def _end_rule_before(self, date, meal_type):
+        """End the rules covering a slot the day before date; returns whether there were any"""
+        last_date = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+        ended = False
+        rule = self.recurring_rules.rule_for(date, meal_type)
+        while rule is not None:
+            if last_date < (rule.get("start_date") or ""):
+                self.schedule_data["recurring"].remove(rule)
+            else:
+                rule["end_date"] = last_date
+            # An older rule may have been hidden behind this one
+            self.recurring_rules.rebuild()
+            ended = True
+            rule = self.recurring_rules.rule_for(date, meal_type)
+        return ended
+
+    def _commit_rules(self, label=None, before=None):
+        """Persist rule edits and refresh everything derived from them
+
+        With a label, the edit is recorded for undo against the rule list before it.
+        """
+        save_schedule(self.schedule_data)
+        self.recurring_rules.rebuild()
+        self._display_cache.clear()
+        self.recurring_changed.emit()
+        if label:
+            from command_log import RulesEdit
+            after = copy.deepcopy(self.schedule_data.get("recurring", []))
+            self.record_command(RulesEdit(label, before, after))
+
+    # Undo/redo
+
+    @property
+    def command_log(self):
+        """Undo/redo history of edits made through the store"""
+        if self._command_log is None:
+            from command_log import CommandLog
+            self._command_log = CommandLog()
+        return self._command_log
+
+    def record_command(self, command):
+        """Add an edit to the undo history"""
+        self.command_log.record(command)
+
+    def undo_group(self, label):
+        """Context manager recording every edit made in the block as a single undo step"""
+        return self.command_log.group(label)
+
+    def undo(self):
+        """Undo the latest edit; returns its label, or None if there was nothing to undo"""
+        return self.command_log.undo(self)
+
+    def redo(self):
+        """Redo the latest undone edit; returns its label, or None if there was nothing to redo"""
+        return self.command_log.redo(self)
+
+    # Ingredient tracking
+
+    @property
+    def tracking_index(self):
+        """Tracking records by (dish_name, planned_cooking_date), built on first use"""
+        if self._tracking_index is None:
+            from ingredient_tracking import TrackingIndex
+            self._tracking_index = TrackingIndex(self.tracking_data)
+        return self._tracking_index
+
+    def upcoming_dishes(self, days=None):
+        """Cooked meals in the next days (UPCOMING_DAYS by default) with ingredients still to get"""
+        from ingredient_tracking import upcoming_dishes
+        return upcoming_dishes(self.schedule_data, self.tracking_index, days, rules=self.recurring_rules)
+
+    def tracking_record(self, dish_name, date_str, create=False):
+        """The tracking record of a cooked meal; with create, one is added if there is none"""
+        record = self.tracking_index.get(dish_name, date_str)
+        if record is None and create:
+            from ingredient_tracking import new_record
+            dish = self.find_dish(dish_name) or {}
+            record = new_record(dish_name, date_str, dish.get("ingredients", []))
+            self.tracking_data.setdefault("ingredient_acquisitions", []).append(record)
+            self.tracking_index.add(record)
+        return record
+
+    def set_ingredient_obtained(self, dish_name, date_str, ingredient, obtained):
+        """Tick or untick one ingredient of a cooked meal
+
+        The record is updated in memory at once; the file is written by
+        flush_tracking once no tick has come in for TRACKING_SAVE_DELAY_MS.
+        """
+        record = self.tracking_record(dish_name, date_str, create=True)
+        record.setdefault("ingredients", {})[ingredient] = {"obtained": obtained}
+        self._tracking_dirty = True
+        self._tracking_save_timer.start()
+
+    def flush_tracking(self):
+        """Write any ticks still waiting for the batched save"""
+        if not self._tracking_dirty:
+            return
+        # Ticks only add records through the index, so it stays current
+        self._tracking_dirty = False
+        self._tracking_save_timer.stop()
+        save_ingredient_tracking(self.tracking_data)
+        self.tracking_changed.emit()
+
+    def save_tracking(self):
+        """Persist tracking_data after in-place edits"""
+        # Records may have been added or removed in place
+        self._tracking_index = None
+        self._tracking_dirty = False
+        self._tracking_save_timer.stop()
+        save_ingredient_tracking(self.tracking_data)
+        self.tracking_changed.emit()
+
+    def cleanup_old_ingredient_data(self):
+        """Drop tracking records older than 1 month"""
+        # The file is rewritten, pending ticks included
+        cleanup_old_ingredient_data(self.tracking_data)
+        self._tracking_index = None
+        self._tracking_dirty = False
+        self._tracking_save_timer.stop()
+        self.tracking_changed.emit()
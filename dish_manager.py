@@ -1,68 +1,73 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QListWidget, QLineEdit, QLabel, QTextEdit, QStackedWidget, QFrame, QListWidgetItem, QMessageBox)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-from utilities import load_dishes, save_dishes
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QApplication, QStyle,
+                             QListWidget, QListView, QLineEdit, QLabel, QTextEdit, QStackedWidget, QFrame, QMessageBox,
+                             QStyledItemDelegate, QStyleOptionViewItem, QProgressBar)
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QFont, QColor, QFontMetrics
+from dish_models import DishListModel, DishFilterProxyModel
 
 DATA_FILE = "dishes.json"
 
-class DishWidget(QWidget):
-    def __init__(self, dish_data):
-        super().__init__()
-        self.dish_data = dish_data
-        self.setup_ui()
-        
-    def setup_ui(self):
-        self.setFixedHeight(32)  # Fixed height for consistent list appearance
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(12, 6, 12, 6)  # More breathing room
-        layout.setSpacing(12)
-        
+class DishItemDelegate(QStyledItemDelegate):
+    """Paints a dish row (name plus subtle tags) without a widget per row"""
+    ROW_HEIGHT = 32  # Fixed height for consistent list appearance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
         # Dish name - prominent
-        name_label = QLabel(self.dish_data['name'])
-        name_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                font-weight: 600;
-                font-size: 13px;
-                background-color: transparent;
-                border: none;
-            }
-        """)
-        name_label.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Remove focus highlights
-        layout.addWidget(name_label, 0, Qt.AlignmentFlag.AlignVCenter)  # Center vertically
-        
+        self.name_font = QFont()
+        self.name_font.setPixelSize(13)
+        self.name_font.setWeight(QFont.Weight.DemiBold)
+        self.name_color = QColor("#2c3e50")
+
         # Tags - subtle and gray
-        if self.dish_data['tags']:
-            tags_text = ", ".join(sorted(self.dish_data['tags']))
-            tags_label = QLabel(tags_text)
-            tags_label.setStyleSheet("""
-                QLabel {
-                    color: #6c757d;
-                    font-weight: 400;
-                    font-size: 12px;
-                    font-style: italic;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-            tags_label.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Remove focus highlights
-            layout.addWidget(tags_label, 0, Qt.AlignmentFlag.AlignVCenter)  # Center vertically
-        
-        layout.addStretch()  # Push everything to the left
-        self.setLayout(layout)
+        self.tags_font = QFont()
+        self.tags_font.setPixelSize(12)
+        self.tags_font.setItalic(True)
+        self.tags_color = QColor("#6c757d")
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        dish = index.data(DishListModel.DishRole)
+        if dish is None:
+            return
+
+        # Let the style draw the item background (hover/selected states)
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        rect = opt.rect.adjusted(12, 0, -12, 0)  # More breathing room
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        painter.setFont(self.name_font)
+        painter.setPen(self.name_color)
+        painter.drawText(rect, align, dish['name'])
+
+        if dish['tags']:
+            name_width = QFontMetrics(self.name_font).horizontalAdvance(dish['name'])
+            tags_text = ", ".join(sorted(dish['tags']))
+            painter.setFont(self.tags_font)
+            painter.setPen(self.tags_color)
+            painter.drawText(rect.adjusted(name_width + 12, 0, 0, 0), align, tags_text)
+
+        painter.restore()
 
 class DishManager(QWidget):
-    def __init__(self):
+    def __init__(self, data_store):
         super().__init__()
+        self.data_store = data_store
         
         self.setWindowTitle("Dish Manager")
         self.setMinimumSize(900, 650)
-        self.current_dish_index = None
-        
-        # Apply modern styling
-        self.apply_modern_styling()
+        # The dish being edited (None when adding); a reference rather than a
+        # row, since undo and redo can move rows while the edit view is open
+        self.current_dish = None
         
         # Force application to use system cursor by setting it explicitly
         from PyQt6.QtGui import QCursor
@@ -90,199 +95,12 @@ class DishManager(QWidget):
         # Start with list view
         self.show_list_view()
         
-    def apply_modern_styling(self):
-        """Apply modern, clean styling to the application"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-            
-            QLabel {
-                color: #2c3e50;
-                font-weight: 500;
-            }
-            
-            /* Search input styling */
-            QLineEdit {
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                background-color: white;
-                selection-background-color: #3498db;
-            }
-            
-            QLineEdit:focus {
-                border-color: #3498db;
-                outline: none;
-            }
-            
-            /* Dish list styling - compact and clean */
-            QListWidget {
-                border: 2px solid #e9ecef;
-                border-radius: 12px;
-                background-color: white;
-                alternate-background-color: #f8f9fa;
-                font-size: 13px;
-                padding: 4px;
-            }
-            
-            /* Note: Qt doesn't support partial text styling within list items,
-               so we use subtle separators and spacing to distinguish tags */
-            
-            QListWidget::item {
-                border: none;
-                padding: 6px 12px;
-                margin: 0px;
-                border-radius: 4px;
-                background-color: transparent;
-                border-bottom: 1px solid #f1f3f4;
-            }
-            
-            QListWidget::item:hover {
-                background-color: #f1f8ff;
-                border: 1px solid #cce7ff;
-            }
-            
-            QListWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1976d2;
-                border: 1px solid #2196f3;
-            }
-            
-            /* Modern scrollbar styling */
-            QListWidget QScrollBar:vertical {
-                background-color: #f8f9fa;
-                width: 12px;
-                border: none;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QListWidget QScrollBar::handle:vertical {
-                background-color: #dee2e6;
-                border: none;
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }
-            
-            QListWidget QScrollBar::handle:vertical:pressed {
-                background-color: #6c757d;
-            }
-            
-            QListWidget QScrollBar::add-line:vertical,
-            QListWidget QScrollBar::sub-line:vertical {
-                height: 0px;
-                border: none;
-            }
-            
-            QListWidget QScrollBar::add-page:vertical,
-            QListWidget QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            
-            /* Also style scrollbars in text areas */
-            QTextEdit QScrollBar:vertical {
-                background-color: #f8f9fa;
-                width: 12px;
-                border: none;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QTextEdit QScrollBar::handle:vertical {
-                background-color: #dee2e6;
-                border: none;
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }
-            
-            QTextEdit QScrollBar::handle:vertical:pressed {
-                background-color: #6c757d;
-            }
-            
-            QTextEdit QScrollBar::add-line:vertical,
-            QTextEdit QScrollBar::sub-line:vertical {
-                height: 0px;
-                border: none;
-            }
-            
-            QTextEdit QScrollBar::add-page:vertical,
-            QTextEdit QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            
-            /* Button styling */
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 120px;
-            }
-            
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QPushButton[class="secondary"] {
-                background-color: #95a5a6;
-            }
-            
-            QPushButton[class="secondary"]:hover {
-                background-color: #7f8c8d;
-            }
-            
-            QPushButton[class="danger"] {
-                background-color: #e74c3c;
-            }
-            
-            QPushButton[class="danger"]:hover {
-                background-color: #c0392b;
-            }
-            
-            QPushButton[class="success"] {
-                background-color: #28a745;
-            }
-            
-            QPushButton[class="success"]:hover {
-                background-color: #218838;
-            }
-            
-            /* Text area styling */
-            QTextEdit {
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 13px;
-                background-color: white;
-                line-height: 1.4;
-            }
-            
-            QTextEdit:focus {
-                border-color: #3498db;
-            }
-            
-            /* Only style frames that need visual separation */
-            QFrame[class="card"] {
-                background-color: white;
-                border: 1px solid #e9ecef;
-                border-radius: 12px;
-                padding: 15px;
-            }
-        """)
+        # Follow a background load of the library, if one is still running
+        self.data_store.dishes_loading.connect(self.on_dishes_loading)
+        self.data_store.dishes_loaded.connect(self.on_dishes_loaded)
+        if self.data_store.is_loading_dishes():
+            self.on_dishes_loading(len(self.dish_model.dishes), 0)
+        self.data_store.dish_changed.connect(self.on_dish_changed)
         
     def setup_list_view(self):
         """Create the dish list view"""
@@ -308,9 +126,27 @@ class DishManager(QWidget):
         self.filter_input.textChanged.connect(self.filter_dishes)
         list_layout.addWidget(self.filter_input)
         
+        # Shown while a large library is still streaming in
+        self.load_progress = QProgressBar()
+        self.load_progress.setTextVisible(True)
+        self.load_progress.setFormat("Loading dishes... %v of %m")
+        self.load_progress.setMaximumHeight(18)
+        self.load_progress.hide()
+        list_layout.addWidget(self.load_progress)
+        
         # Dish list directly in main layout
-        self.dish_list = QListWidget()
-        self.dish_list.itemDoubleClicked.connect(self.edit_selected_dish)
+        # Rows come from the data store's shared dish model, are painted by a
+        # delegate and filtered through a proxy, so searching never creates or
+        # destroys widgets
+        self.dish_model = self.data_store.dish_model
+        self.dish_proxy = DishFilterProxyModel(self)
+        self.dish_proxy.setSourceModel(self.dish_model)
+
+        self.dish_list = QListView()
+        self.dish_list.setModel(self.dish_proxy)
+        self.dish_list.setItemDelegate(DishItemDelegate(self.dish_list))
+        self.dish_list.setUniformItemSizes(True)
+        self.dish_list.doubleClicked.connect(self.edit_selected_dish)
         self.dish_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Remove native focus highlight
         list_layout.addWidget(self.dish_list)
         
@@ -523,59 +359,38 @@ class DishManager(QWidget):
         
     def load_dish_list(self):
         """Load and display all dishes"""
-        self.dish_list.clear()
-        self.dishes = load_dishes()
-        self.dishes.sort(key=lambda x: x["name"].lower())
+        # A background load fills the model itself
+        if not self.data_store.is_loading_dishes():
+            self.dish_model.set_dishes(self.data_store.dishes)
+            
+    def on_dishes_loading(self, loaded, total):
+        """Show load progress; editing waits until every row has arrived"""
+        if total:
+            self.load_progress.setRange(0, total)
+            self.load_progress.setValue(loaded)
+        else:
+            self.load_progress.setRange(0, 0)  # Busy indicator until the first batch
+        self.load_progress.show()
+        self.add_button.setEnabled(False)
+        self.remove_button.setEnabled(False)
         
-        for dish in self.dishes:
-            # Create custom widget for this dish
-            dish_widget = DishWidget(dish)
-            
-            # Create list item
-            item = QListWidgetItem()
-            item.setSizeHint(dish_widget.size())  # Use actual size instead of sizeHint
-            item.setData(Qt.ItemDataRole.UserRole, dish)
-            
-            # Add to list
-            self.dish_list.addItem(item)
-            self.dish_list.setItemWidget(item, dish_widget)
+    def on_dishes_loaded(self):
+        """Hide the progress bar and re-enable editing"""
+        self.load_progress.hide()
+        self.add_button.setEnabled(True)
+        self.remove_button.setEnabled(True)
             
     def filter_dishes(self):
         """Filter dishes based on search input"""
-        filter_text = self.filter_input.text().lower()
-        
-        if not filter_text:
-            self.load_dish_list()
-            return
-            
-        self.dish_list.clear()
-        
-        for dish in self.dishes:
-            # Search in dish name OR in any tag
-            name_match = filter_text in dish["name"].lower()
-            tag_match = any(filter_text in tag.lower() for tag in dish["tags"])
-            
-            if name_match or tag_match:
-                # Create custom widget for this dish
-                dish_widget = DishWidget(dish)
-                
-                # Create list item
-                item = QListWidgetItem()
-                item.setSizeHint(dish_widget.size())  # Use actual size instead of sizeHint
-                item.setData(Qt.ItemDataRole.UserRole, dish)
-                
-                # Add to list
-                self.dish_list.addItem(item)
-                self.dish_list.setItemWidget(item, dish_widget)
+        self.dish_proxy.set_filter_text(self.filter_input.text())
                 
     def show_list_view(self):
         """Switch to list view"""
-        self.load_dish_list()
         self.stacked_widget.setCurrentWidget(self.list_widget)
         
     def show_add_view(self):
         """Switch to add dish view"""
-        self.current_dish_index = None
+        self.current_dish = None
         self.save_button.setText("Create Dish")
         
         # Clear all inputs
@@ -590,25 +405,19 @@ class DishManager(QWidget):
         self.stacked_widget.setCurrentWidget(self.edit_widget)
         self.dish_name_input.setFocus()
         
-    def edit_selected_dish(self, item):
+    def edit_selected_dish(self, index):
         """Switch to edit view for selected dish"""
-        # Get dish data from the item
-        dish_data = item.data(Qt.ItemDataRole.UserRole)
-        
-        # Find dish index
-        dish_index = None
-        for i, dish in enumerate(self.dishes):
-            if dish['name'] == dish_data['name']:
-                dish_index = i
-                break
-                
-        if dish_index is not None:
-            self.show_edit_view(dish_index)
+        if self.data_store.is_loading_dishes():
+            return
+        # Map the filtered row back to the dish's row in the model
+        source_index = self.dish_proxy.mapToSource(index)
+        if source_index.isValid():
+            self.show_edit_view(source_index.row())
             
     def show_edit_view(self, dish_index):
         """Switch to edit view for specific dish"""
-        self.current_dish_index = dish_index
-        dish = self.dishes[dish_index]
+        dish = self.dish_model.dishes[dish_index]
+        self.current_dish = dish
 
         self.save_button.setText("Save Changes")
         
@@ -691,26 +500,35 @@ class DishManager(QWidget):
             "recipe": recipe
         }
         
-        if self.current_dish_index is None:
-            # Adding new dish
-            self.dishes.append(dish_data)
+        # Save through the data store; the list model updates the one
+        # affected row from its dish_changed signal
+        if self.current_dish is None:
+            # Adding new dish (or one undone away while it was being edited)
+            self.data_store.add_dish(dish_data)
         else:
             # Editing existing dish
-            self.dishes[self.current_dish_index] = dish_data
+            self.data_store.update_dish(self.current_dish, dish_data)
             
-        # Save to file and return to list view
-        save_dishes(self.dishes)
+        # Return to list view
         self.show_list_view()
+        row = self.dish_model.find_row(dish_data)
+        self.dish_list.scrollTo(self.dish_proxy.mapFromSource(self.dish_model.index(row)))
         
+    def on_dish_changed(self, old_dish, new_dish):
+        """Keep following the dish being edited when an undo or redo replaces or removes it"""
+        if old_dish is not None and old_dish is self.current_dish:
+            self.current_dish = new_dish
+            
     def remove_dish(self):
         """Remove selected dish from list"""
-        selected_items = self.dish_list.selectedItems()
-        if not selected_items:
+        selected_indexes = self.dish_list.selectionModel().selectedIndexes()
+        if not selected_indexes:
             return
             
-        for item in selected_items:
-            # Get dish data from the item
-            dish_data = item.data(Qt.ItemDataRole.UserRole)
+        dishes_to_remove = []
+        for index in selected_indexes:
+            # Get the model's own dish object (data() hands back a copy)
+            dish_data = self.dish_model.dishes[self.dish_proxy.mapToSource(index).row()]
             dish_name = dish_data['name']
             
             # Show confirmation dialog
@@ -723,14 +541,9 @@ class DishManager(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                # Find and remove dish
-                for i, dish in enumerate(self.dishes):
-                    if dish['name'] == dish_name:
-                        del self.dishes[i]
-                        break
-                        
-        save_dishes(self.dishes)
-        self.load_dish_list()
+                dishes_to_remove.append(dish_data)
+                
+        self.data_store.remove_dishes(dishes_to_remove)
         
     def back_to_menu(self):
         """Return to main menu"""
@@ -746,7 +559,11 @@ if __name__ == "__main__":
     from PyQt6.QtWidgets import QApplication
     import sys
     
+    from styles import apply_app_stylesheet
+    from data_store import DataStore
+    
     app = QApplication(sys.argv)
-    window = DishManager()
+    apply_app_stylesheet(app)
+    window = DishManager(DataStore())
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
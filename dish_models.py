@@ -0,0 +1,296 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from bisect import bisect_left, bisect_right
+
+class DishListModel(QAbstractListModel):
+    """List model holding the dish library, sorted by name"""
+    DishRole = Qt.ItemDataRole.UserRole
+    SearchKeyRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dishes = []
+        self.sort_keys = []
+        self.search_keys = []
+        self._name_rows = None
+
+    def set_dishes(self, dishes):
+        """Replace the model contents and rebuild the search index"""
+        self.beginResetModel()
+        self.dishes = sorted(dishes, key=self.collation_key)
+        self.sort_keys = [self.collation_key(dish) for dish in self.dishes]
+        # One lowercase haystack per row: name and tags separated by newlines,
+        # which cannot be typed into the single-line search box
+        self.search_keys = [self.build_search_key(dish) for dish in self.dishes]
+        self._name_rows = None
+        self.endResetModel()
+
+    def append_rows(self, dishes, sort_keys, search_keys):
+        """Append prepared rows that all sort after the existing ones"""
+        if not dishes:
+            return
+        first = len(self.dishes)
+        self.beginInsertRows(QModelIndex(), first, first + len(dishes) - 1)
+        self.dishes.extend(dishes)
+        self.sort_keys.extend(sort_keys)
+        self.search_keys.extend(search_keys)
+        self._name_rows = None
+        self.endInsertRows()
+
+    @staticmethod
+    def collation_key(dish):
+        return dish["name"].lower()
+
+    @staticmethod
+    def build_search_key(dish):
+        return "\n".join([dish["name"]] + list(dish["tags"])).lower()
+
+    def find_row(self, dish):
+        """Return the row holding this dish object, or -1"""
+        key = self.collation_key(dish)
+        row = bisect_left(self.sort_keys, key)
+        while row < len(self.sort_keys) and self.sort_keys[row] == key:
+            if self.dishes[row] is dish:
+                return row
+            row += 1
+        return -1
+
+    def row_for_name(self, dish_name):
+        """Return the row of the dish with this name, or -1
+        
+        The name map is rebuilt lazily after the rows change, so lookups
+        are O(1) between edits.
+        """
+        if self._name_rows is None:
+            self._name_rows = {}
+            for row, dish in enumerate(self.dishes):
+                self._name_rows.setdefault(dish["name"], row)
+        return self._name_rows.get(dish_name, -1)
+
+    def on_dish_changed(self, old_dish, new_dish):
+        """Apply a DataStore.dish_changed notification to the affected row"""
+        if old_dish is None:
+            self.insert_dish(new_dish)
+            return
+
+        row = self.find_row(old_dish)
+        if row < 0:
+            return
+        if new_dish is None:
+            self.remove_row(row)
+        else:
+            self.update_dish(row, new_dish)
+
+    def insert_dish(self, dish):
+        """Insert a dish at its sorted position and return its row"""
+        key = self.collation_key(dish)
+        row = bisect_right(self.sort_keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.dishes.insert(row, dish)
+        self.sort_keys.insert(row, key)
+        self.search_keys.insert(row, self.build_search_key(dish))
+        self._name_rows = None
+        self.endInsertRows()
+        return row
+
+    def update_dish(self, row, dish):
+        """Replace the dish at row, moving it only if its sort position changed"""
+        key = self.collation_key(dish)
+        before_ok = row == 0 or self.sort_keys[row - 1] <= key
+        after_ok = row == len(self.sort_keys) - 1 or key <= self.sort_keys[row + 1]
+        if not (before_ok and after_ok):
+            self.remove_row(row)
+            return self.insert_dish(dish)
+
+        self.dishes[row] = dish
+        self.sort_keys[row] = key
+        self.search_keys[row] = self.build_search_key(dish)
+        self._name_rows = None
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return row
+
+    def remove_row(self, row):
+        """Remove the dish at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.dishes[row]
+        del self.sort_keys[row]
+        del self.search_keys[row]
+        self._name_rows = None
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.dishes)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.dishes):
+            return None
+
+        dish = self.dishes[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return dish["name"]
+        if role == self.DishRole:
+            return dish
+        if role == self.SearchKeyRole:
+            return self.search_keys[index.row()]
+        return None
+
+class DishFilterProxyModel(QSortFilterProxyModel):
+    """Filters dish rows against the model's search index without rebuilding rows"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_text = ""
+
+    def set_filter_text(self, text):
+        text = text.lower()
+        if text == self.filter_text:
+            return
+        self.filter_text = text
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self.filter_text:
+            return True
+        # Search in dish name OR in any tag
+        return self.filter_text in self.sourceModel().search_keys[source_row]
+
+def match_score(name_key, text):
+    """Rank how well typed text matches a lowercase dish name, or None if it does not
+    
+    Lower is better: name prefix, word prefix, substring, then fuzzy
+    (every typed character appears in order).
+    """
+    if name_key.startswith(text):
+        return 0
+    if any(word.startswith(text) for word in name_key.split()):
+        return 1
+    if text in name_key:
+        return 2
+    pos = 0
+    for char in text:
+        pos = name_key.find(char, pos)
+        if pos < 0:
+            return None
+        pos += 1
+    return 3
+
+class DishPickerModel(QAbstractListModel):
+    """Type-ahead list over a DishListModel, ranking prefix matches above fuzzy ones
+
+    With no filter text the rows are the source rows in name order, so nothing
+    is scored or sorted. Otherwise each row is scored once per keystroke and
+    the matches are ordered with a single sort; text that extends the previous
+    filter only rescores the rows that already matched.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.source = None
+        self.filter_text = ""
+        # Matching source rows in ranked order, or None when unfiltered
+        self.rows = None
+
+    def setSourceModel(self, source):
+        self.beginResetModel()
+        self.source = source
+        self.rows = None
+        self.endResetModel()
+        source.modelAboutToBeReset.connect(self.on_source_about_to_reset)
+        source.modelReset.connect(self.on_source_changed)
+        source.rowsAboutToBeInserted.connect(self.on_rows_about_to_be_inserted)
+        source.rowsInserted.connect(self.on_rows_inserted)
+        source.rowsAboutToBeRemoved.connect(self.on_rows_about_to_be_removed)
+        source.rowsRemoved.connect(self.on_rows_removed)
+        source.dataChanged.connect(self.on_data_changed)
+
+    def set_filter_text(self, text):
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+        candidates = None
+        if self.filter_text and text.startswith(self.filter_text):
+            # Anything matching the longer text matched the shorter one
+            candidates = self.rows
+        self.filter_text = text
+        self.beginResetModel()
+        self.rows = self.match_rows(candidates)
+        self.endResetModel()
+
+    def match_rows(self, candidates=None):
+        """Source rows matching the filter text, best first, or None if unfiltered"""
+        if not self.filter_text:
+            return None
+        sort_keys = self.source.sort_keys
+        if candidates is None:
+            candidates = range(len(sort_keys))
+        scored = []
+        for row in candidates:
+            score = match_score(sort_keys[row], self.filter_text)
+            if score is not None:
+                scored.append((score, row))
+        return [row for score, row in sorted(scored)]
+
+    # Unfiltered, source changes pass straight through; filtered, the matches
+    # are worked out again once the change is done
+    def on_source_about_to_reset(self):
+        self.beginResetModel()
+
+    def on_source_changed(self):
+        self.rows = self.match_rows()
+        self.endResetModel()
+
+    def on_rows_about_to_be_inserted(self, parent, first, last):
+        if self.rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def on_rows_inserted(self, parent, first, last):
+        if self.rows is None:
+            self.endInsertRows()
+        else:
+            self.beginResetModel()
+            self.on_source_changed()
+
+    def on_rows_about_to_be_removed(self, parent, first, last):
+        if self.rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+
+    def on_rows_removed(self, parent, first, last):
+        if self.rows is None:
+            self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self.on_source_changed()
+
+    def on_data_changed(self, top_left, bottom_right, roles=()):
+        if self.rows is None:
+            self.dataChanged.emit(self.index(top_left.row()), self.index(bottom_right.row()))
+        else:
+            self.beginResetModel()
+            self.on_source_changed()
+
+    def mapToSource(self, index):
+        if not index.isValid() or self.source is None:
+            return QModelIndex()
+        row = index.row() if self.rows is None else self.rows[index.row()]
+        return self.source.index(row)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self.rows is None:
+            return self.index(source_index.row())
+        try:
+            return self.index(self.rows.index(source_index.row()))
+        except ValueError:
+            return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.source is None:
+            return 0
+        # Called for every row while the view lays out, so kept to a len()
+        return len(self.source.dishes if self.rows is None else self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self.rowCount():
+            return None
+        return self.source.data(self.mapToSource(index), role)
@@ -0,0 +1,164 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame,
+                             QScrollArea, QCheckBox, QSpinBox)
+from PyQt6.QtCore import Qt, QTimer
+from datetime import date
+from ingredient_tracking import upcoming_days, is_obtained, is_complete
+
+class IngredientChecklistView(QWidget):
+    """Checklist of the ingredients still to get for the upcoming cooked meals
+
+    Ticks go straight into the data store's in-memory tracking records; the
+    store writes them to the tracking file in batches, so ticking through a
+    list costs one write rather than one per checkbox. Schedule changes
+    rebuild the list; saved ticks only drop the cards of meals that are now
+    complete, so the checkbox being ticked keeps its focus and place.
+    """
+    MAX_DAYS = 14
+
+    def __init__(self, data_store):
+        super().__init__()
+        self.data_store = data_store
+
+        # Schedule edits (including undo) refresh the list once the burst is over
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.setup_ui()
+
+        self.data_store.slot_changed.connect(self.schedule_refresh)
+        self.data_store.recurring_changed.connect(self.schedule_refresh)
+        # Emitted with each batched write, so a meal whose last ingredient was
+        # just ticked drops off the list
+        self.data_store.tracking_changed.connect(self.remove_complete_cards)
+
+    def setup_ui(self):
+        """Setup the checklist UI"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(20)
+
+        # Header
+        header_layout = QHBoxLayout()
+
+        back_button = QPushButton("← Back to Menu")
+        back_button.setProperty("class", "secondary")
+        back_button.clicked.connect(self.back_to_menu)
+        header_layout.addWidget(back_button)
+
+        header_layout.addStretch()
+
+        title_label = QLabel("Ingredients to Get")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setProperty("class", "view-title")
+        header_layout.addWidget(title_label)
+
+        header_layout.addStretch()
+
+        header_layout.addWidget(QLabel("Days ahead:"))
+        self.days_spinbox = QSpinBox()
+        self.days_spinbox.setRange(1, self.MAX_DAYS)
+        self.days_spinbox.setValue(min(upcoming_days(), self.MAX_DAYS))
+        self.days_spinbox.valueChanged.connect(self.refresh)
+        header_layout.addWidget(self.days_spinbox)
+
+        layout.addLayout(header_layout)
+
+        # One card per meal, rebuilt on refresh; (dish_name, date) -> its cards
+        self.cards = {}
+        self.meals_widget = QWidget()
+        self.meals_layout = QVBoxLayout()
+        self.meals_layout.setContentsMargins(0, 0, 0, 0)
+        self.meals_layout.setSpacing(15)
+        self.meals_widget.setLayout(self.meals_layout)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        scroll_area.setWidget(self.meals_widget)
+        layout.addWidget(scroll_area)
+
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def schedule_refresh(self, *args):
+        if self.isVisible():
+            self.refresh_timer.start(0)
+
+    def refresh(self):
+        """List the cooked meals in the horizon that still need ingredients"""
+        while self.meals_layout.count():
+            item = self.meals_layout.takeAt(0)
+            if item.widget() is not None:
+                item.widget().deleteLater()
+        self.cards = {}
+
+        meals = self.data_store.upcoming_dishes(self.days_spinbox.value())
+        for meal in meals:
+            card = self.create_meal_card(meal)
+            self.cards.setdefault((meal["dish_name"], meal["date"]), []).append(card)
+            self.meals_layout.addWidget(card)
+        self.meals_layout.addStretch()
+        if not meals:
+            self.show_empty_note()
+
+    def remove_complete_cards(self):
+        """Drop the cards of meals whose ingredients have all been obtained"""
+        if not self.isVisible():
+            return
+        for key in list(self.cards):
+            if is_complete(self.data_store.tracking_record(*key)):
+                for card in self.cards.pop(key):
+                    self.meals_layout.removeWidget(card)
+                    card.deleteLater()
+                if not self.cards:
+                    self.show_empty_note()
+
+    def show_empty_note(self):
+        empty_label = QLabel(f"Everything is in for the next {self.days_spinbox.value()} day(s).")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_label.setProperty("class", "empty-note")
+        self.meals_layout.insertWidget(0, empty_label)
+
+    def create_meal_card(self, meal):
+        """A card with the meal's heading and a checkbox per ingredient"""
+        dish_name, date_str = meal["dish_name"], meal["date"]
+        card = QFrame()
+        card.setProperty("class", "card")
+        card_layout = QVBoxLayout()
+        card_layout.setSpacing(6)
+
+        day = date.fromisoformat(date_str)
+        heading = QLabel(f"{dish_name} — {day.strftime('%A %m/%d')}, {meal['meal_type'].capitalize()}")
+        heading.setProperty("class", "meal-heading")
+        card_layout.addWidget(heading)
+
+        dish = self.data_store.find_dish(dish_name) or {}
+        ingredients = dish.get("ingredients", [])
+        if not ingredients:
+            card_layout.addWidget(QLabel("No ingredients listed for this dish."))
+
+        record = self.data_store.tracking_record(dish_name, date_str)
+        for ingredient in ingredients:
+            checkbox = QCheckBox(ingredient)
+            checkbox.setChecked(is_obtained(record, ingredient))
+            checkbox.toggled.connect(
+                lambda checked, ingredient=ingredient: self.data_store.set_ingredient_obtained(
+                    dish_name, date_str, ingredient, checked))
+            card_layout.addWidget(checkbox)
+
+        card.setLayout(card_layout)
+        return card
+
+    def back_to_menu(self):
+        """Return to main menu"""
+        # Find the parent MainMenu window
+        parent = self.parent()
+        while parent and not hasattr(parent, 'show_menu'):
+            parent = parent.parent()
+
+        if parent:
+            parent.show_menu()
@@ -0,0 +1,77 @@
+"""Lookups into the ingredient tracking records by dish and cooking date
+
+ingredient_tracking.json keeps a list of acquisition records, one per cooked
+meal that ingredients are being gathered for:
+    {"dish_name": ..., "planned_cooking_date": "YYYY-MM-DD",
+     "ingredients": {"2 cups - flour": {"obtained": true}, ...}}
+
+TrackingIndex maps (dish_name, planned_cooking_date) to its record, so
+finding the record for a scheduled meal is a dict lookup rather than a scan
+of every record. The data store keeps one current as records are added or
+cleaned up.
+"""
+import os
+from datetime import date, timedelta
+
+from recurring_rules import meals_in_range
+
+# How many days, starting today, are checked for ingredients still to get
+UPCOMING_DAYS = 2
+
+def upcoming_days():
+    """The upcoming horizon in days: UPCOMING_DAYS from the environment, at least 1"""
+    try:
+        return max(1, int(os.getenv("UPCOMING_DAYS", UPCOMING_DAYS)))
+    except ValueError:
+        return UPCOMING_DAYS
+
+class TrackingIndex:
+    """Tracking records keyed by (dish_name, planned_cooking_date)"""
+    def __init__(self, tracking_data=None):
+        self.records = {}
+        if tracking_data:
+            for record in tracking_data.get("ingredient_acquisitions", []):
+                self.add(record)
+
+    def add(self, record):
+        """Index a record; an earlier record for the same meal is kept"""
+        key = (record.get("dish_name"), record.get("planned_cooking_date"))
+        self.records.setdefault(key, record)
+
+    def get(self, dish_name, date_str):
+        return self.records.get((dish_name, date_str))
+
+def new_record(dish_name, date_str, ingredients):
+    """Tracking record for a cooked meal with none of its ingredients obtained yet"""
+    return {
+        "dish_name": dish_name,
+        "planned_cooking_date": date_str,
+        "ingredients": {ingredient: {"obtained": False} for ingredient in ingredients}
+    }
+
+def is_obtained(record, ingredient):
+    return bool(record and record.get("ingredients", {}).get(ingredient, {}).get("obtained", False))
+
+def is_complete(record):
+    """True if every ingredient on a tracking record has been obtained"""
+    return record is not None and all(
+        ingredient.get("obtained", False) for ingredient in record.get("ingredients", {}).values())
+
+def upcoming_dishes(schedule_data, index, days=None, start_date=None, rules=None):
+    """Cooked meals in the next days (today included) whose ingredients are not all obtained
+
+    Returns dicts with dish_name, date and meal_type in schedule order. days
+    defaults to upcoming_days(). Only the slots in the horizon are looked at,
+    each with one index lookup.
+    """
+    if days is None:
+        days = upcoming_days()
+    first_day = date.fromisoformat(start_date) if start_date else date.today()
+    last_day = first_day + timedelta(days=max(days, 1) - 1)
+    upcoming = []
+    for date_str, meal_type, meal_data in meals_in_range(schedule_data, first_day.isoformat(),
+                                                         last_day.isoformat(), rules):
+        dish_name = meal_data.get("dish_name")
+        if meal_data.get("type") == "cook" and dish_name and not is_complete(index.get(dish_name, date_str)):
+            upcoming.append({"dish_name": dish_name, "date": date_str, "meal_type": meal_type})
+    return upcoming
@@ -0,0 +1,186 @@
+"""Structured ingredients parsed from the "amount - name" strings dishes keep
+
+DishManager stores each ingredient as free text such as "1 1/2 cups - flour".
+parse_ingredient() turns one into a (quantity, unit, name) record with an
+exact Fraction quantity (None for amounts such as "some") and a canonical
+unit spelling (see units.py). Results are memoised per raw string, since the
+same strings repeat across dishes.
+
+Dishes also carry their parsed records under "parsed_ingredients", written
+whenever a dish is saved, so aggregation reads them without parsing.
+migrate_dishes() fills them in for a library saved before they existed, or
+by an older version of the parser:
+    python ingredients.py --migrate
+"""
+import argparse
+import os
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+from units import canonical_unit
+
+# Stored records from an older parser are parsed again
+PARSER_VERSION = 3
+
+VULGAR_FRACTIONS = {
+    "½": Fraction(1, 2), "⅓": Fraction(1, 3), "⅔": Fraction(2, 3), "¼": Fraction(1, 4),
+    "¾": Fraction(3, 4), "⅕": Fraction(1, 5), "⅛": Fraction(1, 8), "⅜": Fraction(3, 8),
+    "⅝": Fraction(5, 8), "⅞": Fraction(7, 8),
+}
+
+# A comma before exactly three digits groups thousands ("1,000"); any other
+# comma is a decimal comma ("1,5")
+_NUMBER = re.compile(r"(?:(\d{1,3}(?:,\d{3})+)(?!\d)|(\d+(?:[.,]\d+)?|\.\d+))(?:\s*/\s*(\d+))?\s*")
+_FRACTION = re.compile(r"\d+\s*/\s*[1-9]")
+_RANGE = re.compile(r"(?:-|–|to)\s*")
+_FLUID_OUNCE = re.compile(r"fl\.?\s*oz\.?\b")
+
+def _take_number(text):
+    """Read one number, fraction or vulgar fraction; returns (Fraction, rest) or (None, text)"""
+    if text[:1] in VULGAR_FRACTIONS:
+        return VULGAR_FRACTIONS[text[0]], text[1:].lstrip()
+    match = _NUMBER.match(text)
+    if not match:
+        return None, text
+    if match.group(1):
+        value = Fraction(match.group(1).replace(",", ""))
+    else:
+        value = Fraction(match.group(2).replace(",", "."))
+    if match.group(3):
+        if int(match.group(3)) == 0:
+            return None, text
+        value /= int(match.group(3))
+    return value, text[match.end():]
+
+def parse_quantity(text):
+    """Split a leading quantity off an amount; returns (Fraction or None, rest)
+
+    Handles "2", "1.5", ".5", "1,5", "1,000", "1/2", "1 1/2", "1½" and
+    "a"/"an". Of a range such as "2-3" the upper bound is kept, so there is
+    always enough.
+    """
+    rest = text.strip()
+    first_word = rest.split(" ", 1)
+    if first_word[0].lower() in ("a", "an"):
+        return Fraction(1), first_word[1] if len(first_word) > 1 else ""
+    quantity, rest = _take_number(rest)
+    if quantity is None:
+        return None, rest
+    # A mixed number: a whole number followed by a fraction
+    if quantity.denominator == 1 and (rest[:1] in VULGAR_FRACTIONS or _FRACTION.match(rest)):
+        part, rest = _take_number(rest)
+        quantity += part
+    range_match = _RANGE.match(rest)
+    if range_match:
+        upper, after = _take_number(rest[range_match.end():])
+        if upper is not None:
+            quantity, rest = max(quantity, upper), after
+    return quantity, rest.strip()
+
+def parse_unit(text):
+    """Return the unit named by what follows the quantity, or None"""
+    text = text.strip()
+    if not text:
+        return None
+    if _FLUID_OUNCE.match(text.lower()):
+        return "fl oz"
+    # Looked up before lowercasing, since "T" and "t" differ
+    unit = canonical_unit(text.split()[0])
+    if unit is not None:
+        return unit
+    # Not a measuring unit ("cloves", "large"); kept as written
+    return text.lower()
+
+@lru_cache(maxsize=4096)
+def parse_ingredient(raw):
+    """Parse "amount - name" into (quantity, unit, name)
+
+    Strings without " - " (older dishes) are a name with no amount.
+    """
+    amount, separator, name = raw.partition(" - ")
+    if not separator:
+        return None, None, raw.strip()
+    quantity, rest = parse_quantity(amount)
+    return quantity, parse_unit(rest), name.strip()
+
+def format_quantity(quantity):
+    """Write a Fraction the way recipes do: "3", "1/2", "1 1/2", or a decimal for odd fractions"""
+    if quantity.denominator == 1:
+        return str(quantity.numerator)
+    if quantity.denominator > 16:
+        return f"{float(quantity):.2f}".rstrip("0").rstrip(".")
+    whole, part = divmod(quantity, 1)
+    return f"{whole} {part}" if whole else str(part)
+
+def to_record(raw):
+    """JSON-ready record of one parsed ingredient, with the raw string it came from"""
+    quantity, unit, name = parse_ingredient(raw)
+    return {
+        "raw": raw,
+        "version": PARSER_VERSION,
+        "quantity": [quantity.numerator, quantity.denominator] if quantity is not None else None,
+        "unit": unit,
+        "name": name
+    }
+
+def attach_parsed(dish):
+    """Store parsed records for the dish's ingredients on the dish"""
+    dish["parsed_ingredients"] = [to_record(raw) for raw in dish.get("ingredients", [])]
+
+def dish_ingredients(dish):
+    """Return a dish's ingredients as (quantity, unit, name) records
+
+    Uses the stored records while they still match the ingredient strings
+    and parser version, and parses (through the cache) otherwise.
+    """
+    raws = dish.get("ingredients", [])
+    records = dish.get("parsed_ingredients")
+    if records is not None and _records_current(records, raws):
+        return [(Fraction(*record["quantity"]) if record["quantity"] is not None else None,
+                 record["unit"], record["name"]) for record in records]
+    return [parse_ingredient(raw) for raw in raws]
+
+def _records_current(records, raws):
+    return len(records) == len(raws) and all(
+        record.get("raw") == raw and record.get("version") == PARSER_VERSION
+        for record, raw in zip(records, raws))
+
+def migrate_dishes(dishes):
+    """Attach parsed records to every dish missing them or out of date; returns how many changed"""
+    changed = 0
+    for dish in dishes:
+        records = dish.get("parsed_ingredients")
+        if records is None or not _records_current(records, dish.get("ingredients", [])):
+            attach_parsed(dish)
+            changed += 1
+    return changed
+
+def main():
+    from dotenv import load_dotenv
+    from utilities import load_dishes, save_dishes
+
+    parser = argparse.ArgumentParser(description="Parse dish ingredients into structured records")
+    parser.add_argument("--migrate", action="store_true", help="store parsed records on every dish and save")
+    args = parser.parse_args()
+
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+    dishes = load_dishes()
+    if args.migrate:
+        changed = migrate_dishes(dishes)
+        if changed:
+            save_dishes(dishes)
+        print(f"{changed} of {len(dishes)} dish(es) migrated")
+        return
+
+    unparsed = set()
+    for dish in dishes:
+        for quantity, unit, name in dish_ingredients(dish):
+            if quantity is None:
+                unparsed.add(name)
+    print(f"{len(dishes)} dish(es), {len(unparsed)} ingredient(s) without a quantity")
+    for name in sorted(unparsed):
+        print(f"  {name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Re-fitting leftover chains after an edit, moving as few slots as possible
+
+A cooked meal owns the leftovers slots that share its leftover_id. When one
+slot changes, only the chains that slot belonged to before or after the edit
+are looked at: leftovers already in place stay where they are, extras are
+cleared from the end and missing ones go in the first free slots after the
+cooked meal. Chains are found through LeftoverChains and free slots through
+the data store's SlotAllocator, so nothing rescans the schedule.
+
+All edits go through a ScheduleTransaction and are saved (and undone) with it.
+"""
+from slot_allocator import slot_number
+
+class LeftoverChains:
+    """Cooked meals and their leftovers slots, indexed by leftover_id
+
+    Kept current by DataStore.sync_slots, which sees every slot edit.
+    """
+    def __init__(self, schedule_data=None):
+        # leftover_id -> (date, meal_type) of the cooked meal
+        self.cooks = {}
+        # leftover_id -> set of (date, meal_type) leftovers slots
+        self.leftovers = {}
+        # (date, meal_type) -> ("cook" or "leftovers", leftover_id)
+        self.owners = {}
+        if schedule_data:
+            for date_str, meals in schedule_data.get("schedule", {}).items():
+                for meal_type, meal_data in meals.items():
+                    self.update(date_str, meal_type, meal_data)
+
+    def update(self, date_str, meal_type, meal_data):
+        """Re-index one slot after it was set to meal_data (None when emptied)"""
+        slot = (date_str, meal_type)
+        owner = self.owners.pop(slot, None)
+        if owner is not None:
+            kind, leftover_id = owner
+            if kind == "cook":
+                if self.cooks.get(leftover_id) == slot:
+                    del self.cooks[leftover_id]
+            else:
+                chain = self.leftovers[leftover_id]
+                chain.discard(slot)
+                if not chain:
+                    del self.leftovers[leftover_id]
+        if not meal_data:
+            return
+        leftover_id = meal_data.get("leftover_id")
+        if meal_data.get("type") == "cook" and leftover_id:
+            self.cooks[leftover_id] = slot
+            self.owners[slot] = ("cook", leftover_id)
+        elif meal_data.get("type") == "leftovers":
+            self.leftovers.setdefault(leftover_id, set()).add(slot)
+            self.owners[slot] = ("leftovers", leftover_id)
+
+    def chain(self, leftover_id):
+        """Return a chain's leftovers slots in schedule order"""
+        return sorted(self.leftovers.get(leftover_id, ()), key=lambda slot: slot_number(*slot))
+
+def leftover_entry(cook_data, cook_date):
+    """Schedule entry for one leftovers meal of a cooked meal"""
+    return {
+        "type": "leftovers",
+        "dish_name": cook_data.get("dish_name"),
+        "cooked_date": cook_date,
+        "leftover_id": cook_data.get("leftover_id")
+    }
+
+def fit_chain(transaction, leftover_id):
+    """Make a chain match its cooked meal's leftover_meals
+
+    Without a cooked meal every leftovers slot of the chain is cleared.
+    """
+    data_store = transaction.data_store
+    chains = data_store.leftover_chains
+    chain = chains.chain(leftover_id)
+    cook_slot = chains.cooks.get(leftover_id)
+    if cook_slot is None:
+        for slot in chain:
+            transaction.delete_slot(*slot)
+        return
+
+    cook_data = data_store.get_scheduled_meal(*cook_slot)
+    cook_number = slot_number(*cook_slot)
+    kept = []
+    for slot in chain:
+        if slot_number(*slot) > cook_number:
+            kept.append(slot)
+        else:
+            transaction.delete_slot(*slot)
+
+    wanted = cook_data.get("leftover_meals", 0)
+    for slot in kept[wanted:]:
+        transaction.delete_slot(*slot)
+
+    entry = leftover_entry(cook_data, cook_slot[0])
+    for slot in kept[:wanted]:
+        if data_store.get_scheduled_meal(*slot) != entry:
+            transaction.set_slot(*slot, dict(entry))
+    missing = wanted - len(kept)
+    if missing > 0:
+        for date_str, meal_type in data_store.slot_allocator.next_free(*cook_slot, missing):
+            transaction.set_slot(date_str, meal_type, dict(entry))
+
+def reflow_slot(transaction, date_str, meal_type, old_meal):
+    """Re-fit the chains affected by a new entry in one slot
+
+    old_meal is what the slot held before the edit (None if it was empty).
+    A cooked meal replaced by another (a different dish or leftover count)
+    keeps the old chain's slots; leftovers overwritten by another meal move
+    to the next free slot; leftovers picked by hand add a meal to the cook.
+    """
+    data_store = transaction.data_store
+    meal_data = data_store.get_scheduled_meal(date_str, meal_type) or {}
+    old_meal = old_meal or {}
+    new_kind, new_id = meal_data.get("type"), meal_data.get("leftover_id")
+    old_kind, old_id = old_meal.get("type"), old_meal.get("leftover_id")
+    cook_id = new_id if new_kind == "cook" else None
+
+    if old_kind == "cook" and old_id and old_id != cook_id:
+        if cook_id:
+            # Hand the old chain's slots to the new cooked meal
+            entry = leftover_entry(meal_data, date_str)
+            for slot in data_store.leftover_chains.chain(old_id):
+                transaction.set_slot(*slot, dict(entry))
+        else:
+            fit_chain(transaction, old_id)
+    elif old_kind == "leftovers" and (new_kind != "leftovers" or new_id != old_id):
+        fit_chain(transaction, old_id)
+
+    if new_kind == "leftovers" and (old_kind != "leftovers" or old_id != new_id):
+        cook_slot = data_store.leftover_chains.cooks.get(new_id)
+        if cook_slot is not None:
+            cook_data = data_store.get_scheduled_meal(*cook_slot)
+            transaction.set_slot(*cook_slot, dict(cook_data, leftover_meals=cook_data.get("leftover_meals", 0) + 1))
+
+    if cook_id:
+        fit_chain(transaction, cook_id)
+
+def drop_leftover(transaction, date_str, meal_type):
+    """Clear one leftovers slot and lower its cooked meal's leftover_meals to match"""
+    data_store = transaction.data_store
+    meal_data = data_store.get_scheduled_meal(date_str, meal_type) or {}
+    transaction.delete_slot(date_str, meal_type)
+    cook_slot = data_store.leftover_chains.cooks.get(meal_data.get("leftover_id"))
+    if cook_slot is not None:
+        cook_data = data_store.get_scheduled_meal(*cook_slot)
+        transaction.set_slot(*cook_slot, dict(cook_data, leftover_meals=max(0, cook_data.get("leftover_meals", 0) - 1)))
@@ -1,20 +1,38 @@
 import sys
 import os
-from PyQt6.QtWidgets import QApplication
-from dotenv import load_dotenv
+import startup_profile
+from startup_profile import measure
 
 if __name__ == "__main__":
+    # --profile-startup prints import/construction timings after first paint and exits
+    if "--profile-startup" in sys.argv:
+        sys.argv.remove("--profile-startup")
+        startup_profile.enable()
+    
+    with measure("import PyQt6"):
+        from PyQt6.QtWidgets import QApplication
+    with measure("import dotenv"):
+        from dotenv import load_dotenv
+    
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
     # Load .env file from the script directory
     load_dotenv(os.path.join(script_dir, '.env'))
     
-    app = QApplication(sys.argv)
+    with measure("QApplication"):
+        app = QApplication(sys.argv)
+    
+    # One shared stylesheet for every view
+    with measure("stylesheet"):
+        from styles import apply_app_stylesheet
+        apply_app_stylesheet(app)
     
     # Import here to avoid circular imports
-    from main_menu import MainMenu
+    with measure("import main_menu"):
+        from main_menu import MainMenu
     
-    window = MainMenu()
+    with measure("MainMenu"):
+        window = MainMenu()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
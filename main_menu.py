@@ -1,15 +1,30 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget,
+                             QMessageBox)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QKeySequence, QShortcut
+from data_store import DataStore, ScheduleError
+import os
+import startup_profile
+from startup_profile import measure, mark
+
+def preload_views_enabled():
+    """Whether views are built in idle time after startup (PRELOAD_VIEWS=0 turns it off)"""
+    return os.getenv("PRELOAD_VIEWS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def schedule_check_mode():
+    """How leftover chains are checked after startup: SCHEDULE_CHECK=report (default), repair or off
+
+    report shows the problems and repairs them only if the user agrees;
+    repair fixes them without asking and then shows what was fixed.
+    """
+    mode = os.getenv("SCHEDULE_CHECK", "report").strip().lower()
+    return mode if mode in ("repair", "report", "off") else "report"
 
 class MainMenuView(QWidget):
     def __init__(self, main_app):
         super().__init__()
         self.main_app = main_app
         
-        # Apply modern styling consistent with existing app
-        self.apply_styling()
-        
         # Create main layout
         self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(40, 40, 40, 40)
@@ -69,6 +84,13 @@ class MainMenuView(QWidget):
         self.dish_manager_button.setProperty("class", "menu-primary")
         button_container.addWidget(self.dish_manager_button)
         
+        # Ingredient checklist for the next few days' cooking
+        self.checklist_button = QPushButton("Ingredients to Get")
+        self.checklist_button.setFixedSize(250, 150)
+        self.checklist_button.clicked.connect(self.open_ingredient_checklist)
+        self.checklist_button.setProperty("class", "menu-secondary")
+        button_container.addWidget(self.checklist_button)
+        
         button_container.addStretch()
         self.main_layout.addLayout(button_container)
         
@@ -77,52 +99,6 @@ class MainMenuView(QWidget):
         
         self.setLayout(self.main_layout)
         
-    def apply_styling(self):
-        """Apply modern styling consistent with existing dish manager"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-            
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 20px;
-                font-size: 16px;
-                font-weight: 600;
-                text-align: center;
-            }
-            
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QPushButton[class="menu-primary"] {
-                background-color: #28a745;
-            }
-            
-            QPushButton[class="menu-primary"]:hover {
-                background-color: #218838;
-            }
-            
-            QPushButton[class="menu-secondary"] {
-                background-color: #17a2b8;
-            }
-            
-            QPushButton[class="menu-secondary"]:hover {
-                background-color: #138496;
-            }
-        """)
-    
     def open_dish_manager(self):
         """Open the existing dish manager"""
         self.main_app.show_dish_manager()
@@ -130,6 +106,10 @@ class MainMenuView(QWidget):
     def open_scheduler(self):
         """Open the meal scheduler"""
         self.main_app.show_scheduler()
+        
+    def open_ingredient_checklist(self):
+        """Open the ingredient checklist"""
+        self.main_app.show_ingredient_checklist()
 
 class MainMenu(QWidget):
     """Main application window with stacked views"""
@@ -138,6 +118,11 @@ class MainMenu(QWidget):
         self.setWindowTitle("Dish Manager")
         self.setMinimumSize(1200, 700)
         
+        # Single in-memory copy of all data, shared by every view; the files
+        # are read on first use or after the menu has been painted
+        self.data_store = DataStore(self)
+        self.first_paint_done = False
+        
         # Create stacked widget for different views
         self.stacked_widget = QStackedWidget()
         
@@ -145,6 +130,7 @@ class MainMenu(QWidget):
         self.menu_view = MainMenuView(self)
         self.dish_manager_view = None
         self.scheduler_view = None
+        self.ingredient_checklist_view = None
         
         # Add menu view to stack
         self.stacked_widget.addWidget(self.menu_view)
@@ -155,28 +141,150 @@ class MainMenu(QWidget):
         main_layout.addWidget(self.stacked_widget)
         self.setLayout(main_layout)
         
+        # Undo/redo of schedule and dish edits from any view; a focused text
+        # field keeps these keys for its own undo
+        undo_shortcut = QShortcut(QKeySequence.StandardKey.Undo, self)
+        undo_shortcut.activated.connect(self.undo)
+        redo_shortcut = QShortcut(QKeySequence.StandardKey.Redo, self)
+        redo_shortcut.activated.connect(self.redo)
+        
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            mark("first paint")
+            # Anything not needed to draw the menu waits until it is on screen
+            QTimer.singleShot(0, self.run_deferred_startup)
+            
+    def run_deferred_startup(self):
+        """Load the data files and drop old tracking records after first paint"""
+        with measure("load data"):
+            self.data_store.load()
+        with measure("cleanup_old_ingredient_data"):
+            self.data_store.cleanup_old_ingredient_data()
+            
+        if startup_profile.is_enabled():
+            self.profile_views()
+            return
+        if schedule_check_mode() != "off":
+            QTimer.singleShot(0, self.check_schedule)
+        if preload_views_enabled():
+            # One view per idle slot so input is handled in between
+            QTimer.singleShot(0, self.preload_dish_manager)
+            
+    def check_schedule(self):
+        """Check the leftover chains in idle time and show any problems found"""
+        issues = self.data_store.check_schedule()
+        if not issues:
+            return
+            
+        repair_now = schedule_check_mode() == "repair"
+        if not repair_now:
+            reply = self.schedule_issues_box(
+                QMessageBox.Icon.Warning, "Schedule Problems",
+                f"Found {len(issues)} problem(s) with leftovers in the schedule.\n\nRepair them now?",
+                issues, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No).exec()
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+                
+        # Re-checked and repaired as one undoable batch
+        try:
+            self.data_store.check_schedule(repair=True)
+        except ScheduleError as error:
+            QMessageBox.warning(self, "Cannot Repair Schedule", str(error))
+            return
+            
+        if repair_now:
+            self.schedule_issues_box(
+                QMessageBox.Icon.Information, "Schedule Repaired",
+                f"Repaired {len(issues)} problem(s) with leftovers in the schedule. Undo puts them back.",
+                issues, QMessageBox.StandardButton.Ok).exec()
+            
+    def schedule_issues_box(self, icon, title, text, issues, buttons):
+        """Message box listing schedule check issues under Show Details"""
+        box = QMessageBox(icon, title, text, buttons, self)
+        box.setDetailedText("\n".join(f"{issue['date']} {issue['meal_type']}: {issue['message']}"
+                                      for issue in issues))
+        return box
+            
+    def preload_dish_manager(self):
+        """Build and polish the dish manager ahead of its first use"""
+        if self.dish_manager_view is None:
+            self.ensure_dish_manager().ensurePolished()
+        QTimer.singleShot(0, self.preload_scheduler)
+        
+    def preload_scheduler(self):
+        """Build and polish the scheduler ahead of its first use"""
+        if self.scheduler_view is None:
+            self.ensure_scheduler().ensurePolished()
+            
+    def profile_views(self):
+        """Build both views for --profile-startup, print the report and quit"""
+        self.show_dish_manager()
+        self.show_scheduler()
+        self.show_menu()
+        startup_profile.report()
+        QApplication.instance().quit()
+        
+    def undo(self):
+        """Undo the latest schedule or dish edit"""
+        self.replay_edit(self.data_store.undo, "Cannot Undo")
+        
+    def redo(self):
+        """Redo the latest undone schedule or dish edit"""
+        self.replay_edit(self.data_store.redo, "Cannot Redo")
+        
+    def replay_edit(self, step, error_title):
+        """Run an undo or redo step, reporting one the schedule rejects"""
+        try:
+            step()
+        except ScheduleError as error:
+            QMessageBox.warning(self, error_title, str(error))
+            
     def show_menu(self):
         """Show the main menu"""
         self.stacked_widget.setCurrentWidget(self.menu_view)
         
-    def show_dish_manager(self):
-        """Show the dish manager"""
+    def ensure_dish_manager(self):
+        """Return the dish manager view, building it on first use"""
         if self.dish_manager_view is None:
-            from dish_manager import DishManager
-            self.dish_manager_view = DishManager()
+            with measure("import dish_manager"):
+                from dish_manager import DishManager
+            with measure("DishManager view"):
+                self.dish_manager_view = DishManager(self.data_store)
             # Remove the dish manager's own window setup
             self.dish_manager_view.setWindowTitle("")
             self.stacked_widget.addWidget(self.dish_manager_view)
+        return self.dish_manager_view
         
-        self.stacked_widget.setCurrentWidget(self.dish_manager_view)
+    def show_dish_manager(self):
+        """Show the dish manager"""
+        self.stacked_widget.setCurrentWidget(self.ensure_dish_manager())
         
-    def show_scheduler(self):
-        """Show the scheduler"""
+    def ensure_scheduler(self):
+        """Return the scheduler view, building it on first use"""
         if self.scheduler_view is None:
-            from scheduler import Scheduler
-            self.scheduler_view = Scheduler()
+            with measure("import scheduler"):
+                from scheduler import Scheduler
+            with measure("Scheduler view"):
+                self.scheduler_view = Scheduler(self.data_store)
             # Remove the scheduler's own window setup
             self.scheduler_view.setWindowTitle("")
             self.stacked_widget.addWidget(self.scheduler_view)
+        return self.scheduler_view
+        
+    def show_scheduler(self):
+        """Show the scheduler"""
+        self.stacked_widget.setCurrentWidget(self.ensure_scheduler())
+        
+    def ensure_ingredient_checklist(self):
+        """Return the ingredient checklist view, building it on first use"""
+        if self.ingredient_checklist_view is None:
+            from ingredient_checklist import IngredientChecklistView
+            self.ingredient_checklist_view = IngredientChecklistView(self.data_store)
+            self.stacked_widget.addWidget(self.ingredient_checklist_view)
+        return self.ingredient_checklist_view
         
-        self.stacked_widget.setCurrentWidget(self.scheduler_view)
\ No newline at end of file
+    def show_ingredient_checklist(self):
+        """Show the ingredient checklist"""
+        self.stacked_widget.setCurrentWidget(self.ensure_ingredient_checklist())
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""Automatic meal planning for a range of dates
+
+Fills the empty slots of a date range with cooked dishes from the library
+(plus their leftovers), keeping every slot that is already scheduled. Each
+candidate plan is built greedily and then improved by local search; several
+candidates run in parallel in a process pool and the cheapest one wins.
+
+Constraints are scored as penalties rather than enforced, so a small library
+still produces a plan:
+  - the same dish cooked twice within no_repeat_days
+  - cooked meals per tag per 7-day block differing from tag_quotas[tag]
+
+Command line use (writes the schedule once):
+    python meal_plan_generator.py 2025-01-06 2025-02-02 --no-repeat 10 --leftovers 1 --quota vegetarian=2
+"""
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from multiprocessing import get_context
+
+from recurring_rules import RecurringRules, resolve_meal
+from slot_allocator import MEAL_TYPES
+
+REPEAT_PENALTY = 100
+QUOTA_PENALTY = 10
+
+# Dishes considered for each slot during greedy construction
+GREEDY_SAMPLE = 200
+
+class PlanProblem:
+    """Everything a worker process needs to build and score candidate plans"""
+    def __init__(self, schedule_data, dishes, start_date, end_date, no_repeat_days, tag_quotas, leftover_meals):
+        self.start = date.fromisoformat(start_date)
+        self.day_count = (date.fromisoformat(end_date) - self.start).days + 1
+        self.no_repeat_days = no_repeat_days
+        self.tag_quotas = dict(tag_quotas or {})
+        self.dish_names = [dish["name"] for dish in dishes]
+        self.dish_tags = {dish["name"]: set(dish.get("tags", [])) for dish in dishes}
+
+        # Recurring rules are expanded for the range only and not kept, so
+        # the problem stays cheap to send to worker processes
+        rules = RecurringRules(schedule_data)
+
+        # Free slots in the range, in order; each cook claims the next
+        # leftover_meals free slots for its leftovers
+        free_slots = []
+        for offset in range(self.day_count):
+            date_str = (self.start + timedelta(days=offset)).isoformat()
+            for meal_type in MEAL_TYPES:
+                if resolve_meal(schedule_data, rules, date_str, meal_type) is None:
+                    free_slots.append((offset, date_str, meal_type))
+        self.layout = []
+        position = 0
+        while position < len(free_slots):
+            leftovers = free_slots[position + 1:position + 1 + leftover_meals]
+            self.layout.append((free_slots[position], leftovers))
+            position += 1 + len(leftovers)
+
+        # Dishes already cooked near the range count towards the repeat rule,
+        # and those inside it towards the tag quotas
+        self.fixed_cooks = []
+        for offset in range(-no_repeat_days, self.day_count + no_repeat_days):
+            date_str = (self.start + timedelta(days=offset)).isoformat()
+            for meal_type in MEAL_TYPES:
+                meal_data = resolve_meal(schedule_data, rules, date_str, meal_type) or {}
+                if meal_data.get("type") == "cook" and meal_data.get("dish_name"):
+                    self.fixed_cooks.append((offset, meal_data["dish_name"]))
+
+    def cost(self, assignment):
+        """Total penalty of a plan given as one dish name per cook slot"""
+        cooks = self.fixed_cooks + [(cook[0][0], name) for cook, name in zip(self.layout, assignment)]
+        total = 0
+
+        days_by_dish = {}
+        for offset, name in cooks:
+            days_by_dish.setdefault(name, []).append(offset)
+        for days in days_by_dish.values():
+            if len(days) > 1:
+                days.sort()
+                total += REPEAT_PENALTY * sum(1 for a, b in zip(days, days[1:]) if b - a < self.no_repeat_days)
+
+        if self.tag_quotas:
+            for block_start in range(0, self.day_count, 7):
+                block_days = min(7, self.day_count - block_start)
+                counts = dict.fromkeys(self.tag_quotas, 0)
+                for offset, name in cooks:
+                    if block_start <= offset < block_start + block_days:
+                        for tag in self.dish_tags.get(name, ()):
+                            if tag in counts:
+                                counts[tag] += 1
+                for tag, per_week in self.tag_quotas.items():
+                    target = round(per_week * block_days / 7)
+                    total += QUOTA_PENALTY * abs(counts[tag] - target)
+        return total
+
+def solve(problem, seed, iterations):
+    """Build one candidate plan; returns (assignment, cost)"""
+    rng = random.Random(seed)
+    if not problem.layout or not problem.dish_names:
+        return [], 0
+
+    # Greedy: fill cook slots in order with the cheapest of a sample of dishes
+    assignment = []
+    for index in range(len(problem.layout)):
+        sample = rng.sample(problem.dish_names, min(GREEDY_SAMPLE, len(problem.dish_names)))
+        best_name, best_cost = None, None
+        for name in sample:
+            cost = problem.cost(assignment + [name])
+            if best_cost is None or cost < best_cost:
+                best_name, best_cost = name, cost
+        assignment.append(best_name)
+
+    # Local search: random replacements and swaps, keeping any that do not make it worse
+    current_cost = problem.cost(assignment)
+    for _ in range(iterations):
+        if current_cost == 0:
+            break
+        candidate = list(assignment)
+        i = rng.randrange(len(candidate))
+        if len(candidate) > 1 and rng.random() < 0.5:
+            j = rng.randrange(len(candidate))
+            candidate[i], candidate[j] = candidate[j], candidate[i]
+        else:
+            candidate[i] = rng.choice(problem.dish_names)
+        cost = problem.cost(candidate)
+        if cost <= current_cost:
+            assignment, current_cost = candidate, cost
+    return assignment, current_cost
+
+def generate_plan(schedule_data, dishes, start_date, end_date, no_repeat_days=7, tag_quotas=None,
+                  leftover_meals=0, candidates=4, workers=None, iterations=2000, seed=None):
+    """Plan the empty slots between start_date and end_date (inclusive)
+
+    Returns (plan, cost) where plan maps date -> meal_type -> meal data in the
+    same shape MealPlanningView saves, ready for apply_plan().
+    """
+    problem = PlanProblem(schedule_data, dishes, start_date, end_date,
+                          no_repeat_days, tag_quotas, leftover_meals)
+    base_seed = random.randrange(2 ** 32) if seed is None else seed
+    seeds = [base_seed + i for i in range(candidates)]
+
+    if candidates > 1 and workers != 1:
+        # spawn rather than fork: the caller may be running a Qt event loop
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            results = list(pool.map(solve, [problem] * len(seeds), seeds, [iterations] * len(seeds)))
+    else:
+        results = [solve(problem, seed, iterations) for seed in seeds]
+
+    assignment, cost = min(results, key=lambda result: result[1])
+    return build_plan(problem, assignment), cost
+
+def build_plan(problem, assignment):
+    """Turn one dish per cook slot into schedule entries, leftovers included"""
+    plan = {}
+    for ((_, date_str, meal_type), leftovers), dish_name in zip(problem.layout, assignment):
+        leftover_id = f"{dish_name.lower().replace(' ', '-')}-{date_str}"
+        plan.setdefault(date_str, {})[meal_type] = {
+            "type": "cook",
+            "dish_name": dish_name,
+            "leftover_meals": len(leftovers),
+            "leftover_id": leftover_id
+        }
+        for _, leftover_date, leftover_meal_type in leftovers:
+            plan.setdefault(leftover_date, {})[leftover_meal_type] = {
+                "type": "leftovers",
+                "dish_name": dish_name,
+                "cooked_date": date_str,
+                "leftover_id": leftover_id
+            }
+    return plan
+
+def apply_plan(data_store, plan):
+    """Schedule a plan as one validated, undoable batch; returns the set of changed slots
+
+    Raises ScheduleError, leaving the schedule untouched, if the plan would
+    break a leftover chain.
+    """
+    with data_store.begin_schedule("Generate meal plan") as transaction:
+        for date_str, meals in plan.items():
+            for meal_type, meal_data in meals.items():
+                transaction.set_slot(date_str, meal_type, meal_data)
+    return transaction.changed_slots
+
+def main():
+    from dotenv import load_dotenv
+    from data_store import DataStore, ScheduleError
+
+    parser = argparse.ArgumentParser(description="Fill the empty slots of a date range with a generated meal plan")
+    parser.add_argument("start", help="first day, YYYY-MM-DD")
+    parser.add_argument("end", help="last day, YYYY-MM-DD")
+    parser.add_argument("--no-repeat", type=int, default=7, help="days before a dish may be cooked again")
+    parser.add_argument("--leftovers", type=int, default=0, help="leftover meals per cooked dish")
+    parser.add_argument("--quota", action="append", default=[], metavar="TAG=N",
+                        help="cooked meals tagged TAG per week (repeatable)")
+    parser.add_argument("--candidates", type=int, default=4, help="candidate plans to compare")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without saving it")
+    args = parser.parse_args()
+
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+    tag_quotas = {}
+    for quota in args.quota:
+        tag, _, count = quota.partition("=")
+        tag_quotas[tag] = int(count)
+
+    # Edits go through the data store so the plan is validated like any other
+    data_store = DataStore()
+    plan, cost = generate_plan(data_store.schedule_data, data_store.dishes, args.start, args.end,
+                               no_repeat_days=args.no_repeat, tag_quotas=tag_quotas,
+                               leftover_meals=args.leftovers, candidates=args.candidates,
+                               workers=args.workers, seed=args.seed)
+
+    for date_str in sorted(plan):
+        for meal_type in MEAL_TYPES:
+            meal_data = plan[date_str].get(meal_type)
+            if meal_data:
+                print(f"{date_str} {meal_type:<6} {meal_data['type']:<9} {meal_data['dish_name']}")
+    print(f"penalty: {cost}")
+
+    if not args.dry_run and plan:
+        try:
+            apply_plan(data_store, plan)
+        except ScheduleError as error:
+            print(f"plan rejected, schedule not saved: {error}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
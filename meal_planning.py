@@ -1,24 +1,289 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QComboBox, QSpinBox, QFrame, QRadioButton, QButtonGroup, QStackedWidget, QScrollArea)
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QListView,
+                             QLabel, QComboBox, QSpinBox, QFrame, QRadioButton, QButtonGroup, QStackedWidget, QScrollArea,
+                             QSpacerItem, QSizePolicy, QLineEdit, QMessageBox, QCheckBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from datetime import datetime, timedelta
-from utilities import load_dishes, load_schedule, save_schedule, find_leftover_chain, remove_leftover_chain, find_next_available_slots
+from dish_models import DishPickerModel
+from data_store import ScheduleError
+from leftover_reflow import reflow_slot, drop_leftover
+from slot_allocator import slot_number
+
+# Meal types that can be repeated weekly by a recurring rule; cooked meals and
+# leftovers stay one-off because their leftover chains are tied to a date
+REPEATABLE_MEAL_TYPES = ("bought", "frozen")
+
+DROPDOWN_BUTTON_STYLE = """
+    QLabel {
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 8px 12px;
+        background-color: white;
+        font-size: 13px;
+        color: #2c3e50;
+    }
+    QLabel:hover { border-color: #3498db; }
+"""
+
+DROPDOWN_SEARCH_STYLE = """
+    QLineEdit {
+        border: 1px solid #dee2e6;
+        border-top: none;
+        padding: 8px 12px;
+        background-color: white;
+        font-size: 13px;
+    }
+    QLineEdit:focus { border-color: #3498db; }
+"""
+
+class InlineDropdown(QWidget):
+    """Inline expandable dish picker with type-ahead filtering
+    
+    Backed by the shared dish list model through a ranking list model; the list
+    view uses uniform row sizes so only visible rows are laid out and painted.
+    """
+    PLACEHOLDER = "-- Select a dish --"
+    
+    def __init__(self, dish_model):
+        super().__init__()
+        self.dish_model = dish_model
+        self.selected_dish = None
+        self.expanded = False
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Dropdown display using QLabel with click handling
+        self.button = QLabel(self.PLACEHOLDER)
+        self.button.setMinimumHeight(40)
+        self.button.setStyleSheet(DROPDOWN_BUTTON_STYLE)
+        # Make it clickable
+        self.button.mousePressEvent = lambda event: self.toggle_list()
+        layout.addWidget(self.button)
+        
+        # Type-ahead filter
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Type to filter dishes...")
+        self.search_input.setStyleSheet(DROPDOWN_SEARCH_STYLE)
+        self.search_input.textChanged.connect(self.filter_list)
+        self.search_input.returnPressed.connect(self.select_first_match)
+        layout.addWidget(self.search_input)
+        
+        self.proxy_model = DishPickerModel(self)
+        self.proxy_model.setSourceModel(dish_model)
+        
+        # Scrollable list; the view only creates what is visible
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMaximumHeight(150)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.clicked.connect(self.item_selected)
+        layout.addWidget(self.list_view)
+        
+        # Start collapsed
+        self.search_input.hide()
+        self.list_view.hide()
+        
+    def toggle_list(self):
+        if self.expanded:
+            self.collapse()
+        else:
+            self.search_input.show()
+            self.list_view.show()
+            self.search_input.setFocus()
+            self.expanded = True
+            
+    def collapse(self):
+        self.search_input.hide()
+        self.list_view.hide()
+        self.expanded = False
+        
+    def filter_list(self, text):
+        self.proxy_model.set_filter_text(text)
+        self.list_view.scrollToTop()
+        
+    def select_first_match(self):
+        if self.proxy_model.rowCount() > 0:
+            self.item_selected(self.proxy_model.index(0, 0))
+            
+    def item_selected(self, index):
+        source_index = self.proxy_model.mapToSource(index)
+        self.setCurrentIndex(source_index.row())
+        self.collapse()
+        
+    def currentData(self):
+        return self.selected_dish
+        
+    def findData(self, dish_name):
+        return self.dish_model.row_for_name(dish_name)
+        
+    def setCurrentIndex(self, index):
+        if 0 <= index < self.dish_model.rowCount():
+            self.selected_dish = self.dish_model.dishes[index]['name']
+            self.button.setText(self.selected_dish)
+            proxy_index = self.proxy_model.mapFromSource(self.dish_model.index(index))
+            if proxy_index.isValid():
+                self.list_view.setCurrentIndex(proxy_index)
+            
+    def clear_selection(self):
+        """Reset to the placeholder, clear the filter and collapse the list"""
+        self.selected_dish = None
+        self.button.setText(self.PLACEHOLDER)
+        self.search_input.clear()
+        self.list_view.clearSelection()
+        self.collapse()
+
+class LeftoverDropdown(QWidget):
+    """Inline expandable picker for dishes cooked in the past week"""
+    PLACEHOLDER = "-- Select leftover dish --"
+    
+    def __init__(self, schedule_data):
+        super().__init__()
+        self.schedule_data = schedule_data
+        self.selected_leftover = None
+        self.leftover_options = []
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Dropdown display using QLabel with click handling
+        self.button = QLabel(self.PLACEHOLDER)
+        self.button.setMinimumHeight(40)
+        self.button.setStyleSheet(DROPDOWN_BUTTON_STYLE)
+        # Make it clickable
+        self.button.mousePressEvent = lambda event: self.toggle_list()
+        layout.addWidget(self.button)
+        
+        # Scrollable list
+        self.list_widget = QListWidget()
+        self.list_widget.setMaximumHeight(150)
+        self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_widget.itemClicked.connect(self.item_selected)
+        layout.addWidget(self.list_widget)
+        
+        # Start collapsed
+        self.list_widget.hide()
+        self.expanded = False
+        
+    def populate_leftover_options(self, current_date, current_meal_type):
+        """Find available leftover dishes from recent cook meals before this slot"""
+        self.selected_leftover = None
+        self.button.setText(self.PLACEHOLDER)
+        self.list_widget.hide()
+        self.expanded = False
+        self.list_widget.clear()
+        self.list_widget.addItem(self.PLACEHOLDER)
+        
+        # Look for cook meals in the past 7 days that have leftovers; only
+        # those 8 dates are looked up instead of scanning the whole schedule
+        current_date_obj = datetime.strptime(current_date, "%Y-%m-%d")
+        current_slot = slot_number(current_date, current_meal_type)
+        schedule = self.schedule_data.get("schedule", {})
+        self.leftover_options = []
+        
+        # Most recent first
+        for days_ago in range(8):
+            date_str = (current_date_obj - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+            for meal_type, meal_data in schedule.get(date_str, {}).items():
+                # Leftovers can only come from a meal cooked in an earlier slot
+                if meal_data.get("type") == "cook" and slot_number(date_str, meal_type) < current_slot:
+                    dish_name = meal_data.get("dish_name")
+                    leftover_id = meal_data.get("leftover_id")
+                    if dish_name and leftover_id:
+                        self.leftover_options.append({
+                            "display": f"{dish_name} (cooked {date_str})",
+                            "dish_name": dish_name,
+                            "leftover_id": leftover_id,
+                            "cooked_date": date_str
+                        })
+        
+        for option in self.leftover_options:
+            self.list_widget.addItem(option["display"])
+            
+    def toggle_list(self):
+        if self.expanded:
+            self.list_widget.hide()
+            self.expanded = False
+        else:
+            self.list_widget.show()
+            self.expanded = True
+            
+    def item_selected(self, item):
+        self.button.setText(item.text())
+        row = self.list_widget.row(item)
+        if row == 0:
+            self.selected_leftover = None
+        else:
+            # Rows after the placeholder follow leftover_options
+            option = self.leftover_options[row - 1]
+            self.selected_leftover = {
+                "dish_name": option["dish_name"],
+                "leftover_id": option["leftover_id"],
+                "cooked_date": option["cooked_date"]
+            }
+                    
+        self.list_widget.hide()
+        self.expanded = False
+        
+    def get_selected_leftover(self):
+        return self.selected_leftover
 
 class MealPlanningView(QWidget):
-    """View for planning/editing a meal"""
-    def __init__(self, scheduler_parent, date, meal_type, existing_meal=None):
+    """View for planning/editing a meal
+    
+    One instance is built per scheduler and rebound to a slot with bind()
+    each time a cell is opened, so its widgets are reused.
+    """
+    def __init__(self, scheduler_parent, data_store):
         super().__init__()
         self.scheduler_parent = scheduler_parent
+        self.data_store = data_store
+        self.date = None
+        self.meal_type = None
+        self.existing_meal = None
+        # Whether the slot is showing a recurring rule's meal rather than its own
+        self.repeating = False
+        
+        # Shared in-memory data; edits are committed through the data store
+        self.schedule_data = data_store.schedule_data
+        
+        self.setup_ui()
+        
+    def bind(self, date, meal_type, existing_meal=None):
+        """Point the view at a meal slot and reset the form for it"""
         self.date = date
         self.meal_type = meal_type
         self.existing_meal = existing_meal
         
-        self.dishes = load_dishes()
-        self.schedule_data = load_schedule()
+        # Centered title
+        date_obj = datetime.strptime(self.date, "%Y-%m-%d")
+        day_name = date_obj.strftime("%A")
+        date_display = date_obj.strftime("%B %d, %Y")
+        self.title_label.setText(f"Plan {self.meal_type.title()} for {day_name}, {date_display}")
+        
+        self.repeating = (self.data_store.get_scheduled_meal(date, meal_type) is None and
+                          self.data_store.recurring_rules.covers(date, meal_type))
+        self.repeat_checkbox.setText(f"Repeat every {day_name}")
+        self.repeat_checkbox.setChecked(self.repeating)
+        
+        # Delete button only when editing an existing meal
+        self.delete_button.setVisible(bool(self.existing_meal))
+        self.delete_spacing.changeSize(20 if self.existing_meal else 0, 0)
+        self.button_layout.invalidate()
+        
+        # Reset the form
+        self.cook_radio.setChecked(True)
+        self.dish_combo.clear_selection()
+        self.set_leftover_count(0)
+        self.bought_input.clear()
+        self.frozen_input.clear()
+        self.leftover_combo.populate_leftover_options(self.date, self.meal_type)
         
-        self.setup_ui()
         self.load_existing_data()
+        self.on_meal_type_changed()
         
     def setup_ui(self):
         """Setup the meal planning UI"""
@@ -38,12 +303,9 @@ class MealPlanningView(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Centered title
-        date_obj = datetime.strptime(self.date, "%Y-%m-%d")
-        day_name = date_obj.strftime("%A")
-        date_display = date_obj.strftime("%B %d, %Y")
-        
-        title = QLabel(f"Plan {self.meal_type.title()} for {day_name}, {date_display}")
+        # Centered title, filled in by bind()
+        title = QLabel()
+        self.title_label = title
         title_font = QFont()
         title_font.setPointSize(18)
         title_font.setBold(True)
@@ -63,7 +325,6 @@ class MealPlanningView(QWidget):
         content_frame = QFrame()
         content_frame.setProperty("class", "card")
         content_frame.setMinimumSize(600, 500)
-        from PyQt6.QtWidgets import QSizePolicy
         content_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
         # Main content layout
@@ -167,94 +428,8 @@ class MealPlanningView(QWidget):
         dish_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
         dish_layout.addWidget(dish_label)
         
-        # Create inline expandable list - no popup focus issues
-        from PyQt6.QtWidgets import QListWidget, QScrollArea
-        
-        class InlineDropdown(QWidget):
-            def __init__(self, dishes):
-                super().__init__()
-                self.dishes = dishes
-                self.selected_dish = None
-                self.expanded = False
-                
-                layout = QVBoxLayout(self)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                
-                # Dropdown display using QLabel with click handling
-                self.button = QLabel("-- Select a dish --")
-                self.button.setMinimumHeight(40)
-                self.button.setStyleSheet("""
-                    QLabel {
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        padding: 8px 12px;
-                        background-color: white;
-                        font-size: 13px;
-                        color: #2c3e50;
-                    }
-                    QLabel:hover { border-color: #3498db; }
-                """)
-                # Make it clickable
-                self.button.mousePressEvent = lambda event: self.toggle_list()
-                layout.addWidget(self.button)
-                
-                # Scrollable list
-                self.scroll_area = QScrollArea()
-                self.scroll_area.setMaximumHeight(150)
-                self.scroll_area.setWidgetResizable(True)
-                self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-                self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-                
-                self.list_widget = QListWidget()
-                self.list_widget.addItem("-- Select a dish --")
-                for dish in dishes:
-                    self.list_widget.addItem(dish['name'])
-                    
-                self.list_widget.itemClicked.connect(self.item_selected)
-                self.scroll_area.setWidget(self.list_widget)
-                layout.addWidget(self.scroll_area)
-                
-                # Start collapsed
-                self.scroll_area.hide()
-                
-            def toggle_list(self):
-                if self.expanded:
-                    self.scroll_area.hide()
-                    self.expanded = False
-                else:
-                    self.scroll_area.show()
-                    self.expanded = True
-                    
-            def item_selected(self, item):
-                text = item.text()
-                self.button.setText(text)
-                if text == "-- Select a dish --":
-                    self.selected_dish = None
-                else:
-                    self.selected_dish = text
-                self.scroll_area.hide()
-                self.expanded = False
-                
-            def currentData(self):
-                return self.selected_dish
-                
-            def findData(self, dish_name):
-                for i in range(self.list_widget.count()):
-                    if self.list_widget.item(i).text() == dish_name:
-                        return i
-                return -1
-                
-            def setCurrentIndex(self, index):
-                if 0 <= index < self.list_widget.count():
-                    item = self.list_widget.item(index)
-                    self.button.setText(item.text())
-                    if item.text() == "-- Select a dish --":
-                        self.selected_dish = None
-                    else:
-                        self.selected_dish = item.text()
-        
-        self.dish_combo = InlineDropdown(self.dishes)
+        # Inline expandable list - no popup focus issues
+        self.dish_combo = InlineDropdown(self.data_store.dish_model)
         dish_layout.addWidget(self.dish_combo)
         
         # Leftover section
@@ -322,7 +497,6 @@ class MealPlanningView(QWidget):
         bought_help.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
         bought_layout.addWidget(bought_help)
         
-        from PyQt6.QtWidgets import QLineEdit
         self.bought_input = QLineEdit()
         self.bought_input.setPlaceholderText("e.g., Pizza from Tony's, Chinese takeout...")
         self.bought_input.setStyleSheet("""
@@ -390,137 +564,7 @@ class MealPlanningView(QWidget):
         leftovers_layout.addWidget(leftovers_help)
         
         # Create leftover selection dropdown
-        class LeftoverDropdown(QWidget):
-            def __init__(self, schedule_data, current_date):
-                super().__init__()
-                self.schedule_data = schedule_data
-                self.current_date = current_date
-                self.selected_leftover = None
-                
-                layout = QVBoxLayout(self)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                
-                # Dropdown display using QLabel with click handling
-                self.button = QLabel("-- Select leftover dish --")
-                self.button.setMinimumHeight(40)
-                self.button.setStyleSheet("""
-                    QLabel {
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        padding: 8px 12px;
-                        background-color: white;
-                        font-size: 13px;
-                        color: #2c3e50;
-                    }
-                    QLabel:hover { border-color: #3498db; }
-                """)
-                # Make it clickable
-                self.button.mousePressEvent = lambda event: self.toggle_list()
-                layout.addWidget(self.button)
-                
-                # Scrollable list
-                self.scroll_area = QScrollArea()
-                self.scroll_area.setMaximumHeight(150)
-                self.scroll_area.setWidgetResizable(True)
-                self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-                self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-                
-                self.list_widget = QListWidget()
-                self.populate_leftover_options()
-                    
-                self.list_widget.itemClicked.connect(self.item_selected)
-                self.scroll_area.setWidget(self.list_widget)
-                layout.addWidget(self.scroll_area)
-                
-                # Start collapsed
-                self.scroll_area.hide()
-                self.expanded = False
-                
-            def populate_leftover_options(self):
-                """Find available leftover dishes from recent cook meals"""
-                self.list_widget.clear()
-                self.list_widget.addItem("-- Select leftover dish --")
-                
-                # Look for cook meals in the past 7 days that have leftovers
-                current_date_obj = datetime.strptime(self.current_date, "%Y-%m-%d")
-                leftover_options = []
-                
-                if "schedule" in self.schedule_data:
-                    for date_str, meals in self.schedule_data["schedule"].items():
-                        try:
-                            meal_date = datetime.strptime(date_str, "%Y-%m-%d")
-                            days_ago = (current_date_obj - meal_date).days
-                            
-                            # Include meals from past 7 days
-                            if 0 <= days_ago <= 7:
-                                for meal_type, meal_data in meals.items():
-                                    if meal_data.get("type") == "cook":
-                                        dish_name = meal_data.get("dish_name")
-                                        leftover_id = meal_data.get("leftover_id")
-                                        if dish_name and leftover_id:
-                                            display_text = f"{dish_name} (cooked {date_str})"
-                                            leftover_options.append({
-                                                "display": display_text,
-                                                "dish_name": dish_name,
-                                                "leftover_id": leftover_id,
-                                                "cooked_date": date_str
-                                            })
-                        except ValueError:
-                            continue
-                
-                # Sort by date (most recent first)
-                leftover_options.sort(key=lambda x: x["cooked_date"], reverse=True)
-                
-                for option in leftover_options:
-                    self.list_widget.addItem(option["display"])
-                    
-            def toggle_list(self):
-                if self.expanded:
-                    self.scroll_area.hide()
-                    self.expanded = False
-                else:
-                    self.scroll_area.show()
-                    self.expanded = True
-                    
-            def item_selected(self, item):
-                text = item.text()
-                self.button.setText(text)
-                if text == "-- Select leftover dish --":
-                    self.selected_leftover = None
-                else:
-                    # Parse the selected leftover
-                    for i in range(self.list_widget.count()):
-                        if self.list_widget.item(i).text() == text:
-                            # Find the corresponding leftover data
-                            current_date_obj = datetime.strptime(self.current_date, "%Y-%m-%d")
-                            if "schedule" in self.schedule_data:
-                                for date_str, meals in self.schedule_data["schedule"].items():
-                                    try:
-                                        meal_date = datetime.strptime(date_str, "%Y-%m-%d")
-                                        days_ago = (current_date_obj - meal_date).days
-                                        
-                                        if 0 <= days_ago <= 7:
-                                            for meal_type, meal_data in meals.items():
-                                                if (meal_data.get("type") == "cook" and 
-                                                    f"{meal_data.get('dish_name')} (cooked {date_str})" == text):
-                                                    self.selected_leftover = {
-                                                        "dish_name": meal_data.get("dish_name"),
-                                                        "leftover_id": meal_data.get("leftover_id"),
-                                                        "cooked_date": date_str
-                                                    }
-                                                    break
-                                    except ValueError:
-                                        continue
-                            break
-                            
-                self.scroll_area.hide()
-                self.expanded = False
-                
-            def get_selected_leftover(self):
-                return self.selected_leftover
-        
-        self.leftover_combo = LeftoverDropdown(self.schedule_data, self.date)
+        self.leftover_combo = LeftoverDropdown(self.schedule_data)
         leftovers_layout.addWidget(self.leftover_combo)
         leftovers_layout.addStretch()
         self.content_stack.addWidget(self.leftovers_section)
@@ -560,6 +604,10 @@ class MealPlanningView(QWidget):
         # Add the content stack to main layout
         content_layout.addWidget(self.content_stack, 1)
         
+        # Weekly repeat, offered for bought and frozen meals; text set by bind()
+        self.repeat_checkbox = QCheckBox()
+        content_layout.addWidget(self.repeat_checkbox, 0, Qt.AlignmentFlag.AlignCenter)
+        
         # Button section with proper layout
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -572,14 +620,15 @@ class MealPlanningView(QWidget):
         
         button_layout.addSpacing(20)  # 20px gap between buttons
         
-        # Add delete button if editing existing meal
-        if self.existing_meal:
-            delete_button = QPushButton("Delete Meal")
-            delete_button.setMinimumSize(120, 40)
-            delete_button.setProperty("class", "danger")
-            delete_button.clicked.connect(self.delete_meal)
-            button_layout.addWidget(delete_button)
-            button_layout.addSpacing(20)
+        # Delete button, shown by bind() when editing an existing meal
+        self.delete_button = QPushButton("Delete Meal")
+        self.delete_button.setMinimumSize(120, 40)
+        self.delete_button.setProperty("class", "danger")
+        self.delete_button.clicked.connect(self.delete_meal)
+        button_layout.addWidget(self.delete_button)
+        self.delete_spacing = QSpacerItem(20, 0, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
+        button_layout.addItem(self.delete_spacing)
+        self.button_layout = button_layout
         
         self.save_button = QPushButton("Save Meal")
         self.save_button.setMinimumSize(120, 40)
@@ -612,6 +661,7 @@ class MealPlanningView(QWidget):
             self.content_stack.setCurrentWidget(self.leftovers_section)
         else:  # No meal planned
             self.content_stack.setCurrentWidget(self.none_section)
+        self.repeat_checkbox.setVisible(self.bought_radio.isChecked() or self.frozen_radio.isChecked())
             
     def load_existing_data(self):
         """Load existing meal data if editing"""
@@ -658,11 +708,6 @@ class MealPlanningView(QWidget):
             
     def save_meal(self):
         """Save the planned meal"""
-        # Check if we're editing an existing meal that has leftovers
-        old_leftover_id = None
-        if self.existing_meal and self.existing_meal.get("type") == "cook":
-            old_leftover_id = self.existing_meal.get("leftover_id")
-        
         # Determine meal type
         if self.cook_radio.isChecked():
             dish_name = self.dish_combo.currentData()
@@ -716,81 +761,50 @@ class MealPlanningView(QWidget):
                 "type": "none"
             }
         
-        # Handle schedule interruption - remove old leftovers if changing from cook meal
-        if old_leftover_id and old_leftover_id != meal_data.get("leftover_id"):
-            removed_count = remove_leftover_chain(self.schedule_data, old_leftover_id)
-            if removed_count > 0:
-                # Could show user notification here: f"Removed {removed_count} leftover meals"
-                pass
+        repeatable = meal_data["type"] in REPEATABLE_MEAL_TYPES
+        repeat = repeatable and self.repeat_checkbox.isChecked()
+        
+        # The slot and every leftover it affects are saved as one batch
+        transaction = self.data_store.begin_schedule("Save meal")
+        old_meal = self.data_store.get_scheduled_meal(self.date, self.meal_type)
         
-        # Save to schedule
-        if "schedule" not in self.schedule_data:
-            self.schedule_data["schedule"] = {}
+        try:
+            if repeat:
+                # The rule fills the slot, so it must not keep an entry of its own
+                transaction.delete_slot(self.date, self.meal_type)
+            else:
+                # Save to schedule
+                transaction.set_slot(self.date, self.meal_type, meal_data)
             
-        if self.date not in self.schedule_data["schedule"]:
-            self.schedule_data["schedule"][self.date] = {}
+            # Re-fit the leftover chains this slot belonged to, keeping placed
+            # leftovers where they are
+            reflow_slot(transaction, self.date, self.meal_type, old_meal)
+        except Exception:
+            # Put back every slot edited so far rather than leave the batch open
+            transaction.rollback()
+            raise
+        
+        # The batch and any rule change are undone together
+        with self.data_store.undo_group("Save meal"):
+            if not self.commit_transaction(transaction):
+                return
             
-        self.schedule_data["schedule"][self.date][self.meal_type] = meal_data
-        
-        # Handle leftover placement for cook meals
-        if meal_data.get("type") == "cook" and meal_data.get("leftover_meals", 0) > 0:
-            self.place_leftovers(meal_data)
-        
-        save_schedule(self.schedule_data)
+            if repeat and not (self.repeating and meal_data == self.existing_meal):
+                self.data_store.repeat_meal(self.date, self.meal_type, meal_data)
+            elif repeatable and not repeat and self.repeating:
+                # Unticking the repeat ends the rule from this date on
+                self.data_store.stop_repeating(self.date, self.meal_type)
         self.back_to_scheduler()
         
-    def place_leftovers(self, cooked_meal):
-        """Place leftover meals in subsequent slots (Phase 2 preview)"""
-        leftover_count = cooked_meal.get("leftover_meals", 0)
-        dish_name = cooked_meal.get("dish_name")
-        leftover_id = cooked_meal.get("leftover_id")
+    def commit_transaction(self, transaction):
+        """Commit a batch of schedule edits, reporting a rejected batch to the user"""
+        try:
+            transaction.commit()
+        except ScheduleError as error:
+            QMessageBox.warning(self, "Cannot Save Meal", str(error))
+            return False
+        return True
         
-        if leftover_count <= 0:
-            return
-            
-        # Find next available slots
-        start_date = datetime.strptime(self.date, "%Y-%m-%d")
-        placed_count = 0
-        
-        # Start from the next meal (if current is lunch, try dinner same day, then next day)
-        current_date = start_date
-        current_meal_types = ["lunch", "dinner"]
-        current_meal_index = current_meal_types.index(self.meal_type)
-        
-        # Start from next meal slot
-        if current_meal_index < len(current_meal_types) - 1:
-            next_meal_type = current_meal_types[current_meal_index + 1]
-        else:
-            current_date += timedelta(days=1)
-            next_meal_type = current_meal_types[0]
-            
-        while placed_count < leftover_count and current_date <= start_date + timedelta(days=14):
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Check if slot is available
-            if (date_str not in self.schedule_data["schedule"] or 
-                next_meal_type not in self.schedule_data["schedule"][date_str]):
-                
-                # Place leftover
-                if date_str not in self.schedule_data["schedule"]:
-                    self.schedule_data["schedule"][date_str] = {}
-                    
-                self.schedule_data["schedule"][date_str][next_meal_type] = {
-                    "type": "leftovers",
-                    "dish_name": dish_name,
-                    "cooked_date": self.date,
-                    "leftover_id": leftover_id
-                }
-                
-                placed_count += 1
-            
-            # Move to next slot
-            if next_meal_type == "lunch":
-                next_meal_type = "dinner"
-            else:
-                next_meal_type = "lunch"
-                current_date += timedelta(days=1)
-                
     def increase_leftover_count(self):
         """Increase leftover count"""
         if self.leftover_count < 10:
@@ -819,10 +833,14 @@ class MealPlanningView(QWidget):
         
         if leftover_id and self.existing_meal.get("type") == "cook":
             # Find associated leftovers
-            leftover_chain = find_leftover_chain(self.schedule_data, leftover_id)
+            leftover_chain = self.data_store.leftover_chains.chain(leftover_id)
             if leftover_chain:
                 impact_message = f"\nThis will also remove {len(leftover_chain)} scheduled leftover meal(s)."
         
+        if self.data_store.recurring_rules.covers(self.date, self.meal_type):
+            day_name = datetime.strptime(self.date, "%Y-%m-%d").strftime("%A")
+            impact_message += f"\nIt repeats every {day_name}; only this date will be cleared."
+        
         # Show in-window confirmation dialog
         self.show_delete_confirmation(impact_message)
     
@@ -934,24 +952,27 @@ class MealPlanningView(QWidget):
         """Execute the deletion after confirmation"""
         overlay.deleteLater()
         
-        # Get leftover_id before deletion
-        leftover_id = self.existing_meal.get("leftover_id") if self.existing_meal else None
+        transaction = self.data_store.begin_schedule("Delete meal")
+        old_meal = self.data_store.get_scheduled_meal(self.date, self.meal_type)
         
-        # Remove the meal
-        if (self.date in self.schedule_data.get("schedule", {}) and 
-            self.meal_type in self.schedule_data["schedule"][self.date]):
-            del self.schedule_data["schedule"][self.date][self.meal_type]
+        try:
+            if old_meal and old_meal.get("type") == "leftovers":
+                # One leftovers meal fewer; the cooked meal's count follows
+                drop_leftover(transaction, self.date, self.meal_type)
+            else:
+                # Remove the meal, and with it any leftovers it was cooked for
+                transaction.delete_slot(self.date, self.meal_type)
+                reflow_slot(transaction, self.date, self.meal_type, old_meal)
             
-            # Clean up empty date entry
-            if not self.schedule_data["schedule"][self.date]:
-                del self.schedule_data["schedule"][self.date]
-        
-        # Remove associated leftovers if any
-        if leftover_id:
-            remove_leftover_chain(self.schedule_data, leftover_id)
-        
-        save_schedule(self.schedule_data)
-        self.back_to_scheduler()
+            # A recurring rule would show through the emptied slot, so skip this date
+            if self.data_store.recurring_rules.covers(self.date, self.meal_type):
+                transaction.set_slot(self.date, self.meal_type, {"type": "none"})
+        except Exception:
+            transaction.rollback()
+            raise
+        
+        if self.commit_transaction(transaction):
+            self.back_to_scheduler()
     
     def back_to_scheduler(self):
         """Return to scheduler view"""
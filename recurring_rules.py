@@ -0,0 +1,96 @@
+"""Recurring meal rules, stored once in schedule.json and expanded on demand
+
+A rule such as "Friday dinner: bought pizza" is kept under the schedule's
+"recurring" key instead of being written into every Friday:
+
+    {"id": "friday-dinner-2025-01-03", "weekday": 4, "meal_type": "dinner",
+     "start_date": "2025-01-03", "end_date": null,
+     "meal": {"type": "bought", "description": "Pizza"}}
+
+weekday follows date.weekday() (Monday is 0) and end_date is inclusive. An
+explicit entry under "schedule" always overrides the rule for its date, so a
+{"type": "none"} entry skips a single occurrence.
+"""
+from datetime import date, timedelta
+
+from slot_allocator import MEAL_TYPES, slot_number
+
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+def new_rule(date_str, meal_type, meal_data, end_date=None):
+    """Build a rule repeating meal_data in this slot every week from date_str on"""
+    weekday = date.fromisoformat(date_str).weekday()
+    return {
+        "id": f"{WEEKDAY_NAMES[weekday].lower()}-{meal_type}-{date_str}",
+        "weekday": weekday,
+        "meal_type": meal_type,
+        "start_date": date_str,
+        "end_date": end_date,
+        "meal": meal_data
+    }
+
+class RecurringRules:
+    """The schedule's rules indexed by (weekday, meal_type)
+
+    Looking up the rule for a slot only scans the rules for that weekday and
+    meal, so expanding rules for whatever range is on screen is cheap and no
+    occurrence is ever written to disk.
+    """
+    def __init__(self, schedule_data):
+        self.schedule_data = schedule_data
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-index after the rule list changed"""
+        self.by_slot = {}
+        # Past this slot number every week is covered exactly like the one before
+        self.last_change = 0
+        for rule in self.schedule_data.get("recurring", []):
+            self.by_slot.setdefault((rule["weekday"], rule["meal_type"]), []).append(rule)
+            for bound in (rule.get("start_date"), rule.get("end_date")):
+                if bound:
+                    self.last_change = max(self.last_change, slot_number(bound, MEAL_TYPES[-1]) + 1)
+        # The most recently started rule wins where two overlap
+        for rules in self.by_slot.values():
+            rules.sort(key=lambda rule: rule.get("start_date") or "", reverse=True)
+
+    def rule_for(self, date_str, meal_type):
+        """Return the rule covering a slot, or None"""
+        if not self.by_slot:
+            return None
+        for rule in self.by_slot.get((date.fromisoformat(date_str).weekday(), meal_type), ()):
+            if (rule.get("start_date") or "") <= date_str and (not rule.get("end_date") or date_str <= rule["end_date"]):
+                return rule
+        return None
+
+    def meal_for(self, date_str, meal_type):
+        """Return the meal a rule puts in a slot, or None"""
+        rule = self.rule_for(date_str, meal_type)
+        return rule["meal"] if rule else None
+
+    def covers(self, date_str, meal_type):
+        return self.rule_for(date_str, meal_type) is not None
+
+def resolve_meal(schedule_data, rules, date_str, meal_type):
+    """Return the meal in a slot: its explicit entry, else the rule covering it"""
+    meal_data = schedule_data.get("schedule", {}).get(date_str, {}).get(meal_type)
+    if meal_data is None and rules is not None:
+        meal_data = rules.meal_for(date_str, meal_type)
+    return meal_data
+
+def meals_in_range(schedule_data, start_date, end_date, rules=None):
+    """Yield (date, meal_type, meal_data) for each planned slot from start_date to end_date inclusive
+
+    Rule occurrences are expanded for just this range.
+    """
+    if rules is None:
+        rules = RecurringRules(schedule_data)
+    day = date.fromisoformat(start_date)
+    last_day = date.fromisoformat(end_date)
+    while day <= last_day:
+        date_str = day.isoformat()
+        for meal_type in MEAL_TYPES:
+            meal_data = resolve_meal(schedule_data, rules, date_str, meal_type)
+            if meal_data is not None:
+                yield date_str, meal_type, meal_data
+        day += timedelta(days=1)
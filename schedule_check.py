@@ -0,0 +1,125 @@
+"""Integrity check and repair for leftover chains across the whole schedule
+
+A cooked meal with leftover_meals > 0 owns a chain of leftovers slots that
+share its leftover_id. One pass over the schedule buckets every slot by
+leftover_id, then each chain is checked on its own, so the whole check is
+linear in the number of scheduled slots (plus sorting each short chain).
+
+Issues reported, each with the repair for its slot:
+  orphan           leftovers whose leftover_id has no cooked meal -> cleared
+  before_cook      leftovers scheduled before their cooked meal -> cleared
+  over_allocated   more leftovers than leftover_meals; the latest -> cleared
+  under_allocated  fewer leftovers than leftover_meals (usually one was
+                   deleted by hand) -> leftover_meals lowered to match
+  stale            leftovers whose cooked_date or dish_name no longer match
+                   the cooked meal -> rewritten
+
+Command line use:
+    python schedule_check.py            # report only, exit status 1 if anything is wrong
+    python schedule_check.py --repair   # fix and save the schedule once
+"""
+import argparse
+import os
+import sys
+
+from slot_allocator import MEAL_TYPES, slot_number
+
+def check_schedule(schedule_data):
+    """Return a list of issue dicts: kind, date, meal_type, message and repair
+
+    repair is the meal data the slot should hold, or None to clear it.
+    """
+    cooks = {}
+    chains = {}
+    issues = []
+    for date_str, meals in schedule_data.get("schedule", {}).items():
+        for meal_type, meal_data in meals.items():
+            if meal_type not in MEAL_TYPES:
+                continue
+            leftover_id = meal_data.get("leftover_id")
+            if meal_data.get("type") == "cook" and leftover_id:
+                cooks[leftover_id] = (date_str, meal_type, meal_data)
+            elif meal_data.get("type") == "leftovers":
+                chains.setdefault(leftover_id, []).append((slot_number(date_str, meal_type), date_str, meal_type, meal_data))
+
+    for leftover_id, leftovers in chains.items():
+        cook = cooks.get(leftover_id)
+        if cook is None:
+            for _, date_str, meal_type, meal_data in leftovers:
+                issues.append(_issue("orphan", date_str, meal_type, None,
+                                     f"Leftovers of {meal_data.get('dish_name', 'unknown dish')} have no cooked meal"))
+            continue
+
+        cook_date, cook_meal_type, cook_data = cook
+        cook_number = slot_number(cook_date, cook_meal_type)
+        dish_name = cook_data.get("dish_name")
+        leftovers.sort(key=lambda leftover: leftover[0])
+        kept = []
+        for number, date_str, meal_type, meal_data in leftovers:
+            if number <= cook_number:
+                issues.append(_issue("before_cook", date_str, meal_type, None,
+                                     f"Leftovers of {dish_name} come before it is cooked on {cook_date}"))
+            else:
+                kept.append((date_str, meal_type, meal_data))
+
+        wanted = cook_data.get("leftover_meals", 0)
+        for date_str, meal_type, _ in kept[wanted:]:
+            issues.append(_issue("over_allocated", date_str, meal_type, None,
+                                 f"{dish_name} cooked on {cook_date} only has {wanted} leftover meal(s)"))
+        for date_str, meal_type, meal_data in kept[:wanted]:
+            if meal_data.get("cooked_date") != cook_date or meal_data.get("dish_name") != dish_name:
+                issues.append(_issue("stale", date_str, meal_type,
+                                     dict(meal_data, cooked_date=cook_date, dish_name=dish_name),
+                                     f"Leftovers point at {meal_data.get('dish_name')} cooked "
+                                     f"{meal_data.get('cooked_date')}, not {dish_name} cooked {cook_date}"))
+
+    # Cooks whose chain came up short, including those with no leftovers left at all
+    for leftover_id, (cook_date, cook_meal_type, cook_data) in cooks.items():
+        wanted = cook_data.get("leftover_meals", 0)
+        cook_number = slot_number(cook_date, cook_meal_type)
+        placed = sum(1 for leftover in chains.get(leftover_id, ()) if leftover[0] > cook_number)
+        if placed < wanted:
+            issues.append(_issue("under_allocated", cook_date, cook_meal_type,
+                                 dict(cook_data, leftover_meals=placed),
+                                 f"{cook_data.get('dish_name')} expects {wanted} leftover meal(s) but {placed} are scheduled"))
+    return issues
+
+def _issue(kind, date_str, meal_type, repair, message):
+    return {"kind": kind, "date": date_str, "meal_type": meal_type, "repair": repair, "message": message}
+
+def apply_repairs(transaction, issues):
+    """Apply each issue's repair through a ScheduleTransaction (see DataStore.check_schedule)"""
+    for issue in issues:
+        if issue["repair"] is None:
+            transaction.delete_slot(issue["date"], issue["meal_type"])
+        else:
+            transaction.set_slot(issue["date"], issue["meal_type"], issue["repair"])
+
+def main():
+    from dotenv import load_dotenv
+    from data_store import DataStore, ScheduleError
+
+    parser = argparse.ArgumentParser(description="Check the leftover chains in the schedule")
+    parser.add_argument("--repair", action="store_true", help="fix the issues found and save the schedule")
+    args = parser.parse_args()
+
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+    # Repairs go through the data store, as they do in the app
+    data_store = DataStore()
+    issues = data_store.check_schedule()
+    for issue in sorted(issues, key=lambda issue: (issue["date"], MEAL_TYPES.index(issue["meal_type"]))):
+        print(f"{issue['date']} {issue['meal_type']:<6} {issue['kind']:<15} {issue['message']}")
+    print(f"{len(issues)} issue(s)")
+
+    if args.repair and issues:
+        try:
+            data_store.check_schedule(repair=True)
+        except ScheduleError as error:
+            print(f"repair rejected, schedule not saved: {error}")
+            sys.exit(1)
+        print("repaired")
+    elif issues:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
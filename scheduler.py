@@ -1,10 +1,8 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QGridLayout, QFrame, QStackedWidget)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 from datetime import datetime, timedelta
-from utilities import load_schedule, save_schedule, cleanup_old_ingredient_data
-from meal_planning import MealPlanningView
 
 class SchedulerCell(QFrame):
     """Individual cell in the scheduler grid representing one meal slot"""
@@ -13,7 +11,8 @@ class SchedulerCell(QFrame):
         self.date = date
         self.meal_type = meal_type
         self.parent_scheduler = parent_scheduler
-        self.meal_data = None
+        self.display = None
+        self.display_type = "none"
         
         self.setup_ui()
         
@@ -21,6 +20,7 @@ class SchedulerCell(QFrame):
         """Setup the cell UI"""
         self.setFixedHeight(80)
         self.setProperty("class", "scheduler-cell")
+        self.setProperty("meal_type", self.display_type)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
@@ -30,67 +30,58 @@ class SchedulerCell(QFrame):
         self.meal_label = QLabel("No meal planned")
         self.meal_label.setWordWrap(True)
         self.meal_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.meal_label.setStyleSheet("""
-            QLabel {
-                color: #6c757d;
-                font-size: 11px;
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.meal_label.setProperty("class", "cell-text")
         layout.addWidget(self.meal_label)
         
         self.setLayout(layout)
         
+    def bind(self, date):
+        """Rebind this cell to a different date"""
+        self.date = date
+        
     def mouseDoubleClickEvent(self, event):
         """Handle double-click to edit meal"""
         self.parent_scheduler.edit_meal(self.date, self.meal_type)
         
-    def update_meal_display(self, meal_data):
-        """Update the cell display based on meal data"""
-        self.meal_data = meal_data
+    def update_meal_display(self, display):
+        """Update the cell from a (display_type, text) pair prepared by the data store"""
+        self.display = display
         
-        if not meal_data or meal_data.get("type") == "none":
+        display_type, text = display
+        if display_type is None:
+            # Unknown slot type; the cell may still show another date's meal
+            display_type = "none"
             self.meal_label.setText("No meal planned")
-            self.setProperty("meal_type", "none")
-        elif meal_data.get("type") == "cook":
-            dish_name = meal_data.get("dish_name", "Unknown dish")
-            leftover_count = meal_data.get("leftover_meals", 0)
-            text = f"COOK: {dish_name}"
-            if leftover_count > 0:
-                text += f"\n({leftover_count} leftovers)"
+        else:
             self.meal_label.setText(text)
-            self.setProperty("meal_type", "cook")
-        elif meal_data.get("type") == "leftovers":
-            dish_name = meal_data.get("dish_name", "Unknown dish")
-            self.meal_label.setText(f"LEFTOVER: {dish_name}")
-            self.setProperty("meal_type", "leftovers")
-        elif meal_data.get("type") == "bought":
-            description = meal_data.get("description", "Bought meal")
-            self.meal_label.setText(f"BOUGHT: {description}")
-            self.setProperty("meal_type", "bought")
-        elif meal_data.get("type") == "frozen":
-            description = meal_data.get("description", "Frozen food")
-            self.meal_label.setText(f"FROZEN: {description}")
-            self.setProperty("meal_type", "frozen")
             
-        # Refresh style
-        self.style().unpolish(self)
-        self.style().polish(self)
+        # Re-polish only when the meal_type selector actually changes
+        if display_type != self.display_type:
+            self.display_type = display_type
+            self.setProperty("meal_type", display_type)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
 class SchedulerMainView(QWidget):
     """Main scheduler view with weekly grid"""
-    def __init__(self, scheduler_parent=None):
+    def __init__(self, data_store, scheduler_parent=None):
         super().__init__()
+        self.data_store = data_store
         self.scheduler_parent = scheduler_parent
         self.current_start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        self.schedule_data = load_schedule()
+        
+        # Displays for the neighbouring weeks are prepared once the event loop is idle
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.prefetch_adjacent)
         
         self.setup_ui()
         self.load_grid_data()
         
-        # Cleanup old data on startup
-        cleanup_old_ingredient_data()
+        # Repaint individual slots as they change in the shared store
+        self.data_store.slot_changed.connect(self.on_slot_changed)
+        # A rule can change any slot, so rule edits recheck the whole window
+        self.data_store.recurring_changed.connect(self.load_grid_data)
         
     def setup_ui(self):
         """Setup the scheduler UI"""
@@ -128,6 +119,12 @@ class SchedulerMainView(QWidget):
         
         header_layout.addStretch()
         
+        # Long-range month/quarter calendar
+        calendar_button = QPushButton("Calendar")
+        calendar_button.setProperty("class", "secondary")
+        calendar_button.clicked.connect(self.show_calendar)
+        header_layout.addWidget(calendar_button)
+        
         layout.addLayout(header_layout)
         
         # Daily grid
@@ -151,52 +148,20 @@ class SchedulerMainView(QWidget):
         self.grid = QGridLayout()
         self.grid.setSpacing(5)
         
-        # Days headers - show 7 days starting from current_start_date
-        today = datetime.now().date()
-        
+        # Day headers and cells are created once and rebound to new dates
+        # on navigation, so moving the window never allocates widgets
+        self.day_labels = []
         for i in range(7):
-            # Calculate the date for this column
-            column_date = self.current_start_date + timedelta(days=i)
-            is_today = column_date.date() == today
-            
-            # Format day with date
-            day_name = column_date.strftime("%A")
-            date_str = column_date.strftime("%m/%d")
-            day_with_date = f"{day_name}\n{date_str}"
-            
-            day_label = QLabel(day_with_date)
+            day_label = QLabel()
             day_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             day_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            
-            # Different styling for today vs other days
-            if is_today:
-                day_label.setStyleSheet("""
-                    QLabel {
-                        font-weight: bold;
-                        color: white;
-                        background-color: #3498db;
-                        border: 2px solid #2980b9;
-                        border-radius: 4px;
-                        padding: 8px;
-                        margin: 2px;
-                    }
-                """)
-            else:
-                day_label.setStyleSheet("""
-                    QLabel {
-                        font-weight: bold;
-                        color: #2c3e50;
-                        background-color: #e9ecef;
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        padding: 8px;
-                        margin: 2px;
-                    }
-                """)
+            day_label.setProperty("class", "grid-header")
             self.grid.addWidget(day_label, 0, i + 1)
+            self.day_labels.append(day_label)
         
         # Meal type labels
         meal_types = ["Lunch", "Dinner"]
+        self.cell_rows = []
         self.cells = {}
         
         for row, meal_type in enumerate(meal_types, 1):
@@ -204,33 +169,47 @@ class SchedulerMainView(QWidget):
             meal_label = QLabel(meal_type)
             meal_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             meal_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            meal_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    color: #2c3e50;
-                    background-color: #e9ecef;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin: 2px;
-                }
-            """)
+            meal_label.setProperty("class", "grid-header")
             self.grid.addWidget(meal_label, row, 0)
             
             # Create cells for each day
+            row_cells = []
             for col in range(7):
-                date = self.current_start_date + timedelta(days=col)
-                date_str = date.strftime("%Y-%m-%d")
-                
-                cell = SchedulerCell(date_str, meal_type.lower(), self)
+                cell = SchedulerCell(None, meal_type.lower(), self)
                 self.grid.addWidget(cell, row, col + 1)
-                
-                # Store cell reference
-                self.cells[(date_str, meal_type.lower())] = cell
+                row_cells.append(cell)
+            self.cell_rows.append(row_cells)
         
         grid_layout.addLayout(self.grid)
         self.grid_frame.setLayout(grid_layout)
         
+        self.bind_grid_dates()
+        
+    def bind_grid_dates(self):
+        """Point the header labels and cells at the 7 days starting from current_start_date"""
+        today = datetime.now().date()
+        self.cells = {}
+        
+        for col, day_label in enumerate(self.day_labels):
+            # Calculate the date for this column
+            column_date = self.current_start_date + timedelta(days=col)
+            is_today = column_date.date() == today
+            
+            # Format day with date
+            day_name = column_date.strftime("%A")
+            day_label.setText(f"{day_name}\n{column_date.strftime('%m/%d')}")
+            
+            # Different styling for today vs other days
+            if day_label.property("today") != is_today:
+                day_label.setProperty("today", is_today)
+                day_label.style().unpolish(day_label)
+                day_label.style().polish(day_label)
+            
+            date_str = column_date.strftime("%Y-%m-%d")
+            for row_cells in self.cell_rows:
+                cell = row_cells[col]
+                cell.bind(date_str)
+                self.cells[(date_str, cell.meal_type)] = cell
         
     def update_date_label(self):
         """Update the date display label"""
@@ -266,107 +245,42 @@ class SchedulerMainView(QWidget):
         
     def refresh_grid(self):
         """Refresh the grid with new daily data"""
-        # Clear all widgets from grid
-        for i in reversed(range(self.grid.count())):
-            child = self.grid.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        # Recreate day headers - show 7 days starting from current_start_date
-        today = datetime.now().date()
-        
-        for i in range(7):
-            # Calculate the date for this column
-            column_date = self.current_start_date + timedelta(days=i)
-            is_today = column_date.date() == today
-            
-            # Format day with date
-            day_name = column_date.strftime("%A")
-            date_str = column_date.strftime("%m/%d")
-            day_with_date = f"{day_name}\n{date_str}"
-            
-            day_label = QLabel(day_with_date)
-            day_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            day_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            
-            # Different styling for today vs other days
-            if is_today:
-                day_label.setStyleSheet("""
-                    QLabel {
-                        font-weight: bold;
-                        color: white;
-                        background-color: #3498db;
-                        border: 2px solid #2980b9;
-                        border-radius: 4px;
-                        padding: 8px;
-                        margin: 2px;
-                    }
-                """)
-            else:
-                day_label.setStyleSheet("""
-                    QLabel {
-                        font-weight: bold;
-                        color: #2c3e50;
-                        background-color: #e9ecef;
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        padding: 8px;
-                        margin: 2px;
-                    }
-                """)
-            self.grid.addWidget(day_label, 0, i + 1)
-        
-        # Recreate meal type labels and cells
-        self.cells.clear()
-        meal_types = ["Lunch", "Dinner"]
-        
-        for row, meal_type in enumerate(meal_types, 1):
-            # Meal type label
-            meal_label = QLabel(meal_type)
-            meal_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            meal_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            meal_label.setStyleSheet("""
-                QLabel {
-                    font-weight: bold;
-                    color: #2c3e50;
-                    background-color: #e9ecef;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin: 2px;
-                }
-            """)
-            self.grid.addWidget(meal_label, row, 0)
-            
-            # Create cells for each day
-            for col in range(7):
-                date = self.current_start_date + timedelta(days=col)
-                date_str = date.strftime("%Y-%m-%d")
-                
-                cell = SchedulerCell(date_str, meal_type.lower(), self)
-                self.grid.addWidget(cell, row, col + 1)
-                self.cells[(date_str, meal_type.lower())] = cell
-        
+        self.bind_grid_dates()
         self.load_grid_data()
         
-    def load_grid_data(self):
-        """Load and display schedule data for current displayed dates"""
-        schedule = self.schedule_data.get("schedule", {})
+    def load_grid_data(self, slots=None):
+        """Load and display schedule data for current displayed dates
+        
+        If slots is given, only those (date, meal_type) slots are checked.
+        Cells are repainted only when their display actually changed.
+        Recurring rules are expanded by the data store for just these slots.
+        """
+        if slots is None:
+            cells = self.cells.items()
+            # Coalesces rapid navigation into one prefetch after the last step
+            self.prefetch_timer.start(0)
+        else:
+            cells = [(slot, self.cells[slot]) for slot in slots if slot in self.cells]
         
-        for (date_str, meal_type), cell in self.cells.items():
-            if date_str in schedule and meal_type in schedule[date_str]:
-                meal_data = schedule[date_str][meal_type]
-                cell.update_meal_display(meal_data)
-            else:
-                cell.update_meal_display(None)
+        for (date_str, meal_type), cell in cells:
+            display = self.data_store.meal_display(date_str, meal_type)
+            if display != cell.display:
+                cell.update_meal_display(display)
+                
+    def prefetch_adjacent(self):
+        """Prepare displays for the week before and after the visible window"""
+        dates = [(self.current_start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+                 for offset in range(-7, 14)]
+        self.data_store.prefetch_displays(dates)
+                
+    def on_slot_changed(self, date, meal_type):
+        """Refresh the cell for a slot changed in the data store, if visible"""
+        self.load_grid_data([(date, meal_type)])
                 
     def edit_meal(self, date, meal_type):
         """Edit a meal slot"""
-        # Get existing meal data
-        schedule = self.schedule_data.get("schedule", {})
-        existing_meal = None
-        if date in schedule and meal_type in schedule[date]:
-            existing_meal = schedule[date][meal_type]
+        # Get existing meal data, including a recurring rule's meal
+        existing_meal = self.data_store.get_meal(date, meal_type)
             
         # Find the main Scheduler parent
         if self.scheduler_parent and hasattr(self.scheduler_parent, 'show_meal_planning_view'):
@@ -380,6 +294,11 @@ class SchedulerMainView(QWidget):
             if current_widget:
                 current_widget.show_meal_planning_view(date, meal_type, existing_meal)
         
+    def show_calendar(self):
+        """Open the month/quarter calendar"""
+        if self.scheduler_parent:
+            self.scheduler_parent.show_calendar_view()
+        
     def back_to_menu(self):
         """Return to main menu"""
         # Find the parent MainMenu window
@@ -392,23 +311,25 @@ class SchedulerMainView(QWidget):
 
 class Scheduler(QWidget):
     """Main scheduler application window"""
-    def __init__(self):
+    def __init__(self, data_store):
         super().__init__()
+        self.data_store = data_store
         self.setWindowTitle("Meal Scheduler")
         self.setMinimumSize(1200, 700)
         
-        # Apply styling consistent with dish manager
-        self.apply_styling()
-        
         # Use stacked widget for different views
         self.stacked_widget = QStackedWidget()
         
         # Create main scheduler view
-        self.scheduler_view = SchedulerMainView(self)
+        self.scheduler_view = SchedulerMainView(data_store, self)
         self.stacked_widget.addWidget(self.scheduler_view)
         
-        # Meal planning view will be created as needed
+        # Meal planning and calendar views are created on first use and then reused
         self.meal_planning_view = None
+        self.calendar_view = None
+        
+        # Week grid or calendar, whichever the meal planner returns to
+        self.browse_view = self.scheduler_view
         
         # Set layout
         main_layout = QVBoxLayout()
@@ -416,142 +337,33 @@ class Scheduler(QWidget):
         main_layout.addWidget(self.stacked_widget)
         self.setLayout(main_layout)
         
-    def apply_styling(self):
-        """Apply modern styling consistent with dish manager"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-            
-            QLabel {
-                color: #2c3e50;
-                font-weight: 500;
-            }
-            
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 120px;
-            }
-            
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QPushButton[class="secondary"] {
-                background-color: #95a5a6;
-            }
-            
-            QPushButton[class="secondary"]:hover {
-                background-color: #7f8c8d;
-            }
-            
-            QPushButton[class="counter-button"] {
-                background-color: #f8f9fa;
-                color: #2c3e50;
-                border: 1px solid #dee2e6;
-                border-radius: 15px;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 30px;
-                padding: 0px;
-            }
-            
-            QPushButton[class="counter-button"]:hover {
-                background-color: #e9ecef;
-                border-color: #adb5bd;
-            }
-            
-            QPushButton[class="counter-button"]:pressed {
-                background-color: #dee2e6;
-            }
-            
-            QPushButton[class="danger"] {
-                background-color: #dc3545;
-            }
-            
-            QPushButton[class="danger"]:hover {
-                background-color: #c82333;
-            }
-            
-            QPushButton[class="danger"]:pressed {
-                background-color: #bd2130;
-            }
-            
-            QFrame[class="card"] {
-                background-color: white;
-                border: 1px solid #e9ecef;
-                border-radius: 12px;
-                padding: 15px;
-            }
-            
-            QFrame[class="scheduler-cell"] {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            
-            QFrame[class="scheduler-cell"]:hover {
-                background-color: #f1f8ff;
-                border-color: #cce7ff;
-            }
-            
-            QFrame[class="scheduler-cell"][meal_type="cook"] {
-                background-color: #e8f5e8;
-                border-color: #28a745;
-            }
-            
-            QFrame[class="scheduler-cell"][meal_type="leftovers"] {
-                background-color: #fff3cd;
-                border-color: #ffc107;
-            }
-            
-            QFrame[class="scheduler-cell"][meal_type="bought"] {
-                background-color: #e2e3e5;
-                border-color: #6c757d;
-            }
-            
-            QFrame[class="scheduler-cell"][meal_type="frozen"] {
-                background-color: #d1ecf1;
-                border-color: #17a2b8;
-            }
-        """)
-        
     def show_meal_planning_view(self, date, meal_type, existing_meal=None):
         """Switch to meal planning view"""
-        # Remove existing meal planning view if it exists
-        if self.meal_planning_view:
-            self.stacked_widget.removeWidget(self.meal_planning_view)
-            self.meal_planning_view = None
+        # Build the planning view once and rebind it for each slot
+        if self.meal_planning_view is None:
+            from meal_planning import MealPlanningView
+            self.meal_planning_view = MealPlanningView(self, self.data_store)
+            self.stacked_widget.addWidget(self.meal_planning_view)
             
-        # Create new meal planning view
-        self.meal_planning_view = MealPlanningView(self, date, meal_type, existing_meal)
-        self.stacked_widget.addWidget(self.meal_planning_view)
+        self.meal_planning_view.bind(date, meal_type, existing_meal)
         self.stacked_widget.setCurrentWidget(self.meal_planning_view)
         
     def show_scheduler_view(self):
-        """Switch back to scheduler view"""
-        # Refresh the scheduler data
-        self.scheduler_view.schedule_data = load_schedule()
-        self.scheduler_view.load_grid_data()
+        """Switch back to the week grid or calendar the meal planner was opened from"""
+        # Edited slots were already repainted from the data store's slot_changed signal
+        self.stacked_widget.setCurrentWidget(self.browse_view)
         
-        # Switch to scheduler view
+    def show_week_view(self):
+        """Switch to the weekly grid"""
+        self.browse_view = self.scheduler_view
         self.stacked_widget.setCurrentWidget(self.scheduler_view)
         
-        # Clean up meal planning view
-        if self.meal_planning_view:
-            self.stacked_widget.removeWidget(self.meal_planning_view)
-            self.meal_planning_view = None
\ No newline at end of file
+    def show_calendar_view(self):
+        """Switch to the month/quarter calendar"""
+        if self.calendar_view is None:
+            from calendar_view import CalendarView
+            self.calendar_view = CalendarView(self.data_store, self)
+            self.stacked_widget.addWidget(self.calendar_view)
+            
+        self.browse_view = self.calendar_view
+        self.stacked_widget.setCurrentWidget(self.calendar_view)
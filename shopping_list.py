@@ -0,0 +1,90 @@
+"""Shopping list for the cooked meals in a date range
+
+Counts how often each dish is cooked between two dates (recurring rules
+included), looks each dish up once by name and adds up its ingredients'
+quantities per ingredient, multiplied by that count. Amounts in units of
+one dimension are added up (cups and tablespoons, grams and pounds). A dish
+cooked ten times in the range costs one pass over its ingredients, and the parsed
+records stored on dishes (see ingredients.py) mean nothing is parsed here.
+
+Command line use:
+    python shopping_list.py 2025-01-06 2025-01-19
+"""
+import argparse
+import os
+from collections import Counter
+
+from ingredients import dish_ingredients, format_quantity
+from recurring_rules import meals_in_range
+from units import add_amounts
+
+def build_shopping_list(schedule_data, find_dish, start_date, end_date, rules=None):
+    """Return the shopping list for start_date..end_date inclusive
+
+    find_dish maps a dish name to the dish (DataStore.find_dish, or the get
+    of a name -> dish dict). Items are dicts, sorted by name:
+      name        the ingredient as first written
+      amounts     [(quantity, unit)] totals, one per dimension (see units.add_amounts);
+                  unit None is a plain count
+      unmeasured  True if some recipe gives no quantity ("salt")
+      dishes      the dishes that need it
+    """
+    cook_counts = Counter()
+    for _, _, meal_data in meals_in_range(schedule_data, start_date, end_date, rules):
+        if meal_data.get("type") == "cook" and meal_data.get("dish_name"):
+            cook_counts[meal_data["dish_name"]] += 1
+
+    items = {}
+    for dish_name, times in cook_counts.items():
+        dish = find_dish(dish_name)
+        if dish is None:
+            continue
+        for quantity, unit, name in dish_ingredients(dish):
+            key = name.lower()
+            item = items.get(key)
+            if item is None:
+                item = items[key] = {"name": name, "amounts": {}, "unmeasured": False, "dishes": []}
+            if dish_name not in item["dishes"]:
+                item["dishes"].append(dish_name)
+            if quantity is None:
+                item["unmeasured"] = True
+            else:
+                item["amounts"][unit] = item["amounts"].get(unit, 0) + quantity * times
+
+    shopping_list = []
+    for key in sorted(items):
+        item = items[key]
+        item["amounts"] = sorted(add_amounts((quantity, unit) for unit, quantity in item["amounts"].items()),
+                                 key=lambda amount: amount[1] or "")
+        shopping_list.append(item)
+    return shopping_list
+
+def format_amounts(item):
+    """Text for an item's total, e.g. "2 cup + 300 g" or "as needed" """
+    parts = [f"{format_quantity(quantity)} {unit}" if unit else format_quantity(quantity)
+             for quantity, unit in item["amounts"]]
+    if item["unmeasured"]:
+        parts.append("as needed")
+    return " + ".join(parts)
+
+def main():
+    from dotenv import load_dotenv
+    from utilities import load_dishes, load_schedule
+
+    parser = argparse.ArgumentParser(description="Print the ingredients needed for the cooked meals in a date range")
+    parser.add_argument("start", help="first day, YYYY-MM-DD")
+    parser.add_argument("end", help="last day, YYYY-MM-DD")
+    args = parser.parse_args()
+
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+    dishes_by_name = {}
+    for dish in load_dishes():
+        dishes_by_name.setdefault(dish["name"], dish)
+
+    shopping_list = build_shopping_list(load_schedule(), dishes_by_name.get, args.start, args.end)
+    for item in shopping_list:
+        print(f"{item['name']:<30} {format_amounts(item):<24} ({', '.join(item['dishes'])})")
+    print(f"{len(shopping_list)} item(s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Ordered index of occupied schedule slots, for finding free ones quickly"""
+from bisect import bisect_right
+from datetime import date
+
+MEAL_TYPES = ["lunch", "dinner"]
+
+def slot_number(date_str, meal_type):
+    """Position of a slot on one timeline with two slots per day"""
+    return date.fromisoformat(date_str).toordinal() * 2 + MEAL_TYPES.index(meal_type)
+
+def slot_at(number):
+    """Return the (date, meal_type) of a slot number"""
+    day, meal_index = divmod(number, 2)
+    return date.fromordinal(day).isoformat(), MEAL_TYPES[meal_index]
+
+class SlotAllocator:
+    """Occupied slots kept as sorted runs of consecutive slot numbers
+
+    A slot counts as occupied when the schedule has an entry for it. Looking
+    for free slots skips a whole run with one bisect, so the next k free slots
+    after any point cost O(k log n) no matter how full the schedule is, and
+    there is no limit on how far ahead they can be.
+
+    Slots filled by a recurring rule (see recurring_rules.RecurringRules) are
+    not in the runs, since they repeat forever; they are checked one by one
+    through rules when given.
+    """
+    def __init__(self, schedule_data=None, rules=None):
+        # starts[i]..ends[i] (inclusive) is the i-th run of occupied slots
+        self.starts = []
+        self.ends = []
+        self.rules = rules
+        if schedule_data:
+            self.rebuild(schedule_data)
+
+    def rebuild(self, schedule_data):
+        """Index every slot in schedule_data"""
+        numbers = sorted(slot_number(date_str, meal_type)
+                         for date_str, meals in schedule_data.get("schedule", {}).items()
+                         for meal_type in meals if meal_type in MEAL_TYPES)
+        self.starts = []
+        self.ends = []
+        for number in numbers:
+            if self.ends and number <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], number)
+            else:
+                self.starts.append(number)
+                self.ends.append(number)
+
+    def _run_index(self, number):
+        """Index of the run containing number, or -1 if the slot is free"""
+        i = bisect_right(self.starts, number) - 1
+        if i >= 0 and self.ends[i] >= number:
+            return i
+        return -1
+
+    def is_free(self, date_str, meal_type):
+        if self._run_index(slot_number(date_str, meal_type)) >= 0:
+            return False
+        return self.rules is None or not self.rules.covers(date_str, meal_type)
+
+    def occupy(self, date_str, meal_type):
+        """Mark a slot as taken, merging it into neighbouring runs"""
+        number = slot_number(date_str, meal_type)
+        i = bisect_right(self.starts, number) - 1
+        if i >= 0 and self.ends[i] >= number:
+            return
+        joins_left = i >= 0 and self.ends[i] == number - 1
+        joins_right = i + 1 < len(self.starts) and self.starts[i + 1] == number + 1
+        if joins_left and joins_right:
+            self.ends[i] = self.ends[i + 1]
+            del self.starts[i + 1]
+            del self.ends[i + 1]
+        elif joins_left:
+            self.ends[i] = number
+        elif joins_right:
+            self.starts[i + 1] = number
+        else:
+            self.starts.insert(i + 1, number)
+            self.ends.insert(i + 1, number)
+
+    def release(self, date_str, meal_type):
+        """Mark a slot as free, splitting its run if needed"""
+        number = slot_number(date_str, meal_type)
+        i = self._run_index(number)
+        if i < 0:
+            return
+        start, end = self.starts[i], self.ends[i]
+        if start == end:
+            del self.starts[i]
+            del self.ends[i]
+        elif number == start:
+            self.starts[i] = number + 1
+        elif number == end:
+            self.ends[i] = number - 1
+        else:
+            self.ends[i] = number - 1
+            self.starts.insert(i + 1, number + 1)
+            self.ends.insert(i + 1, end)
+
+    def next_free(self, date_str, meal_type, count):
+        """Return the first count free (date, meal_type) slots after the given slot
+
+        Fewer are returned only if recurring rules fill every slot from some
+        point on.
+        """
+        slots = []
+        number = slot_number(date_str, meal_type) + 1
+        # Consecutive slots skipped because a rule fills them
+        rule_skips = 0
+        while len(slots) < count:
+            i = self._run_index(number)
+            if i >= 0:
+                # Jump past the whole occupied run
+                number = self.ends[i] + 1
+                rule_skips = 0
+                continue
+            slot = slot_at(number)
+            if self.rules is not None and self.rules.covers(*slot):
+                # Once the rules stop changing, a whole week of covered slots
+                # means every later slot is covered too
+                rule_skips += 1
+                if rule_skips >= 7 * len(MEAL_TYPES) and number > self.rules.last_change:
+                    break
+                number += 1
+                continue
+            rule_skips = 0
+            slots.append(slot)
+            number += 1
+        return slots
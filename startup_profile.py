@@ -0,0 +1,44 @@
+"""Startup timings recorded by main.py --profile-startup
+
+Kept free of Qt imports so it can time the PyQt6 import itself. Timings are
+only recorded once enable() has been called; otherwise measure() is a no-op.
+"""
+import time
+from contextlib import contextmanager
+
+_start = time.perf_counter()
+_enabled = False
+timings = []
+
+def enable():
+    """Start recording timings"""
+    global _enabled
+    _enabled = True
+
+def is_enabled():
+    return _enabled
+
+@contextmanager
+def measure(label):
+    """Record how long the body takes under label"""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((label, (time.perf_counter() - start) * 1000, None))
+
+def mark(label):
+    """Record a point in time, measured from process start-up"""
+    if _enabled:
+        timings.append((label, None, (time.perf_counter() - _start) * 1000))
+
+def report():
+    """Print the recorded timings in the order they happened"""
+    print(f"{'step':<40} {'took':>10} {'at':>10}")
+    for label, took, at in timings:
+        took_str = f"{took:8.1f}ms" if took is not None else ""
+        at_str = f"{at:8.1f}ms" if at is not None else ""
+        print(f"{label:<40} {took_str:>10} {at_str:>10}")
@@ -0,0 +1,349 @@
+"""Application-wide stylesheet shared by every view
+
+Styling is applied once on the QApplication instead of per widget, so Qt
+parses the CSS a single time. Widgets opt into variants through dynamic
+properties (e.g. class="scheduler-cell", meal_type="cook"), and rules that
+only apply to one view are scoped with the view's class name.
+"""
+
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #f8f9fa;
+        font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
+        font-size: 13px;
+        color: #2c3e50;
+    }
+
+    DishManager QLabel,
+    Scheduler QLabel {
+        color: #2c3e50;
+        font-weight: 500;
+    }
+
+    /* Button styling */
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 20px;
+        font-size: 14px;
+        font-weight: 600;
+    }
+
+    DishManager QPushButton,
+    Scheduler QPushButton {
+        min-width: 120px;
+    }
+
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+
+    QPushButton:pressed {
+        background-color: #21618c;
+    }
+
+    QPushButton[class="secondary"] {
+        background-color: #95a5a6;
+    }
+
+    QPushButton[class="secondary"]:hover {
+        background-color: #7f8c8d;
+    }
+
+    QPushButton[class="danger"] {
+        background-color: #e74c3c;
+    }
+
+    QPushButton[class="danger"]:hover {
+        background-color: #c0392b;
+    }
+
+    QPushButton[class="success"] {
+        background-color: #28a745;
+    }
+
+    QPushButton[class="success"]:hover {
+        background-color: #218838;
+    }
+
+    /* Only style frames that need visual separation */
+    QFrame[class="card"] {
+        background-color: white;
+        border: 1px solid #e9ecef;
+        border-radius: 12px;
+        padding: 15px;
+    }
+
+    /* Main menu */
+    QPushButton[class="menu-primary"],
+    QPushButton[class="menu-secondary"] {
+        border-radius: 12px;
+        padding: 20px;
+        font-size: 16px;
+        text-align: center;
+    }
+
+    QPushButton[class="menu-primary"] {
+        background-color: #28a745;
+    }
+
+    QPushButton[class="menu-primary"]:hover {
+        background-color: #218838;
+    }
+
+    QPushButton[class="menu-secondary"] {
+        background-color: #17a2b8;
+    }
+
+    QPushButton[class="menu-secondary"]:hover {
+        background-color: #138496;
+    }
+
+    /* Dish manager: search input styling */
+    DishManager QLineEdit {
+        border: 2px solid #e9ecef;
+        border-radius: 8px;
+        padding: 10px 12px;
+        font-size: 14px;
+        background-color: white;
+        selection-background-color: #3498db;
+    }
+
+    DishManager QLineEdit:focus {
+        border-color: #3498db;
+        outline: none;
+    }
+
+    /* Dish list styling - compact and clean */
+    DishManager QListView {
+        border: 2px solid #e9ecef;
+        border-radius: 12px;
+        background-color: white;
+        alternate-background-color: #f8f9fa;
+        font-size: 13px;
+        padding: 4px;
+    }
+
+    DishManager QListView::item {
+        border: none;
+        padding: 6px 12px;
+        margin: 0px;
+        border-radius: 4px;
+        background-color: transparent;
+        border-bottom: 1px solid #f1f3f4;
+    }
+
+    DishManager QListView::item:hover {
+        background-color: #f1f8ff;
+        border: 1px solid #cce7ff;
+    }
+
+    DishManager QListView::item:selected {
+        background-color: #e3f2fd;
+        color: #1976d2;
+        border: 1px solid #2196f3;
+    }
+
+    /* Modern scrollbar styling for lists and text areas */
+    DishManager QListView QScrollBar:vertical,
+    DishManager QTextEdit QScrollBar:vertical {
+        background-color: #f8f9fa;
+        width: 12px;
+        border: none;
+        border-radius: 6px;
+        margin: 0px;
+    }
+
+    DishManager QListView QScrollBar::handle:vertical,
+    DishManager QTextEdit QScrollBar::handle:vertical {
+        background-color: #dee2e6;
+        border: none;
+        border-radius: 6px;
+        min-height: 20px;
+        margin: 2px;
+    }
+
+    DishManager QListView QScrollBar::handle:vertical:pressed,
+    DishManager QTextEdit QScrollBar::handle:vertical:pressed {
+        background-color: #6c757d;
+    }
+
+    DishManager QListView QScrollBar::add-line:vertical,
+    DishManager QListView QScrollBar::sub-line:vertical,
+    DishManager QTextEdit QScrollBar::add-line:vertical,
+    DishManager QTextEdit QScrollBar::sub-line:vertical {
+        height: 0px;
+        border: none;
+    }
+
+    DishManager QListView QScrollBar::add-page:vertical,
+    DishManager QListView QScrollBar::sub-page:vertical,
+    DishManager QTextEdit QScrollBar::add-page:vertical,
+    DishManager QTextEdit QScrollBar::sub-page:vertical {
+        background: none;
+    }
+
+    DishManager QPushButton:disabled {
+        background-color: #ced4da;
+        color: #f8f9fa;
+    }
+
+    /* Library load progress */
+    DishManager QProgressBar {
+        border: none;
+        border-radius: 6px;
+        background-color: #e9ecef;
+        color: #6c757d;
+        font-size: 11px;
+        text-align: center;
+    }
+
+    DishManager QProgressBar::chunk {
+        border-radius: 6px;
+        background-color: #3498db;
+    }
+
+    /* Text area styling */
+    DishManager QTextEdit {
+        border: 2px solid #e9ecef;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 13px;
+        background-color: white;
+        line-height: 1.4;
+    }
+
+    DishManager QTextEdit:focus {
+        border-color: #3498db;
+    }
+
+    /* Scheduler */
+    Scheduler QPushButton[class="danger"] {
+        background-color: #dc3545;
+    }
+
+    Scheduler QPushButton[class="danger"]:hover {
+        background-color: #c82333;
+    }
+
+    Scheduler QPushButton[class="danger"]:pressed {
+        background-color: #bd2130;
+    }
+
+    QPushButton[class="counter-button"] {
+        background-color: #f8f9fa;
+        color: #2c3e50;
+        border: 1px solid #dee2e6;
+        border-radius: 15px;
+        font-size: 16px;
+        font-weight: bold;
+        min-width: 30px;
+        padding: 0px;
+    }
+
+    QPushButton[class="counter-button"]:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+
+    QPushButton[class="counter-button"]:pressed {
+        background-color: #dee2e6;
+    }
+
+    QLabel[class="grid-header"] {
+        font-weight: bold;
+        color: #2c3e50;
+        background-color: #e9ecef;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 8px;
+        margin: 2px;
+    }
+
+    QLabel[class="grid-header"][today="true"] {
+        color: white;
+        background-color: #3498db;
+        border: 2px solid #2980b9;
+    }
+
+    QFrame[class="scheduler-cell"] {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        margin: 2px;
+    }
+
+    QFrame[class="scheduler-cell"]:hover {
+        background-color: #f1f8ff;
+        border-color: #cce7ff;
+    }
+
+    QFrame[class="scheduler-cell"][meal_type="cook"] {
+        background-color: #e8f5e8;
+        border-color: #28a745;
+    }
+
+    QFrame[class="scheduler-cell"][meal_type="leftovers"] {
+        background-color: #fff3cd;
+        border-color: #ffc107;
+    }
+
+    QFrame[class="scheduler-cell"][meal_type="bought"] {
+        background-color: #e2e3e5;
+        border-color: #6c757d;
+    }
+
+    QFrame[class="scheduler-cell"][meal_type="frozen"] {
+        background-color: #d1ecf1;
+        border-color: #17a2b8;
+    }
+
+    QLabel[class="cell-text"] {
+        color: #6c757d;
+        font-size: 11px;
+        background-color: transparent;
+        border: none;
+    }
+
+    /* Scheduler calendar */
+    CalendarView QTableView {
+        border: 1px solid #e9ecef;
+        border-radius: 12px;
+        background-color: white;
+        padding: 4px;
+    }
+
+    CalendarView QHeaderView::section {
+        background-color: #e9ecef;
+        color: #2c3e50;
+        border: none;
+        padding: 8px;
+        font-weight: bold;
+    }
+
+    /* Ingredient checklist */
+    IngredientChecklistView QLabel[class="view-title"] {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        margin: 0 20px;
+    }
+
+    IngredientChecklistView QLabel[class="meal-heading"] {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+
+    IngredientChecklistView QLabel[class="empty-note"] {
+        color: #6c757d;
+        font-size: 14px;
+    }
+"""
+
+
+def apply_app_stylesheet(app):
+    """Install the shared stylesheet on the QApplication"""
+    app.setStyleSheet(APP_STYLESHEET)
@@ -0,0 +1,159 @@
+"""Measuring units: canonical names, dimensions and exact conversions
+
+Every unit belongs to one dimension (volume, mass or count) and has an exact
+Fraction size in that dimension's base unit (ml, g, a single item). US
+customary measures use their legal definitions, so 1 cup is exactly
+236.5882365 ml. The factor between every pair of units of the same dimension
+is worked out once at import, so a conversion is one dict lookup and one
+multiplication.
+
+An amount with no unit ("2 - eggs") counts items. Units that are not in the
+registry ("cloves", "large") have no dimension and only add up with
+themselves.
+
+Command line use (a quick check, see benchmarks.py for timings):
+    python units.py 2 cup ml
+"""
+import argparse
+from fractions import Fraction
+
+# Canonical spelling for the unit names people type
+UNIT_ALIASES = {
+    "tsp": "tsp", "teaspoon": "tsp", "teaspoons": "tsp",
+    "tbsp": "tbsp", "tbs": "tbsp", "tbl": "tbsp", "tablespoon": "tbsp", "tablespoons": "tbsp",
+    "cup": "cup", "cups": "cup", "c": "cup",
+    "ml": "ml", "milliliter": "ml", "milliliters": "ml", "millilitre": "ml", "millilitres": "ml",
+    "l": "l", "liter": "l", "liters": "l", "litre": "l", "litres": "l",
+    "fl oz": "fl oz", "pint": "pint", "pints": "pint", "quart": "quart", "quarts": "quart",
+    "gallon": "gallon", "gallons": "gallon",
+    "g": "g", "gr": "g", "gram": "g", "grams": "g", "gramme": "g", "grammes": "g",
+    "kg": "kg", "kilo": "kg", "kilos": "kg", "kilogram": "kg", "kilograms": "kg",
+    "mg": "mg", "milligram": "mg", "milligrams": "mg",
+    "oz": "oz", "ounce": "oz", "ounces": "oz",
+    "lb": "lb", "lbs": "lb", "pound": "lb", "pounds": "lb",
+    "piece": "piece", "pieces": "piece", "pc": "piece", "pcs": "piece",
+    "dozen": "dozen",
+}
+
+# Abbreviations whose case matters: recipes write "T" for tablespoons and "t"
+# for teaspoons, so these are looked up before lowercasing
+CASE_SENSITIVE_ALIASES = {"T": "tbsp", "t": "tsp"}
+
+_TEASPOON = Fraction("4.92892159375")
+_OUNCE = Fraction("28.349523125")
+
+# Canonical unit -> (dimension, size in the dimension's base unit)
+UNITS = {
+    "ml": ("volume", Fraction(1)),
+    "l": ("volume", Fraction(1000)),
+    "tsp": ("volume", _TEASPOON),
+    "tbsp": ("volume", 3 * _TEASPOON),
+    "fl oz": ("volume", 6 * _TEASPOON),
+    "cup": ("volume", 48 * _TEASPOON),
+    "pint": ("volume", 96 * _TEASPOON),
+    "quart": ("volume", 192 * _TEASPOON),
+    "gallon": ("volume", 768 * _TEASPOON),
+    "mg": ("mass", Fraction(1, 1000)),
+    "g": ("mass", Fraction(1)),
+    "kg": ("mass", Fraction(1000)),
+    "oz": ("mass", _OUNCE),
+    "lb": ("mass", 16 * _OUNCE),
+    None: ("count", Fraction(1)),
+    "piece": ("count", Fraction(1)),
+    "dozen": ("count", Fraction(12)),
+}
+
+# (from unit, to unit) -> factor, for every pair within a dimension
+CONVERSIONS = {
+    (from_unit, to_unit): from_size / to_size
+    for from_unit, (from_dimension, from_size) in UNITS.items()
+    for to_unit, (to_dimension, to_size) in UNITS.items()
+    if from_dimension == to_dimension
+}
+
+def canonical_unit(name):
+    """Canonical spelling of a unit name, or None if it is not a known unit"""
+    name = name.strip().rstrip(".")
+    if name in CASE_SENSITIVE_ALIASES:
+        return CASE_SENSITIVE_ALIASES[name]
+    return UNIT_ALIASES.get(name.lower())
+
+def dimension(unit):
+    """"volume", "mass" or "count", or None for a unit outside the registry"""
+    entry = UNITS.get(unit)
+    return entry[0] if entry else None
+
+def convert(quantity, from_unit, to_unit):
+    """Convert an exact quantity between two units of the same dimension
+
+    Raises ValueError for units of different (or no) dimension.
+    """
+    if from_unit == to_unit:
+        return quantity
+    factor = CONVERSIONS.get((from_unit, to_unit))
+    if factor is None:
+        raise ValueError(f"Cannot convert {from_unit or 'items'} to {to_unit or 'items'}")
+    return quantity * factor
+
+def convert_all(quantities, from_unit, to_unit):
+    """Convert many quantities between the same two units"""
+    if from_unit == to_unit:
+        return list(quantities)
+    factor = CONVERSIONS.get((from_unit, to_unit))
+    if factor is None:
+        raise ValueError(f"Cannot convert {from_unit or 'items'} to {to_unit or 'items'}")
+    return [quantity * factor for quantity in quantities]
+
+def add_amounts(amounts):
+    """Add up (quantity, unit) amounts, folding together those of one dimension
+
+    Returns one (quantity, unit) per dimension, plus one per unit outside the
+    registry. A dimension's total is given in the largest unit that went into
+    it (1 cup + 2 tbsp is 1 1/8 cup), except counts, which are plain numbers
+    unless everything was counted in the same unit.
+    """
+    # Sum per unit first, so each unit is converted once however many amounts use it
+    per_unit = {}
+    for quantity, unit in amounts:
+        per_unit[unit] = per_unit.get(unit, 0) + quantity
+
+    totals = {}
+    for unit, quantity in per_unit.items():
+        entry = UNITS.get(unit)
+        key = entry[0] if entry else unit
+        size = entry[1] if entry else Fraction(1)
+        total = totals.get(key)
+        if total is None:
+            totals[key] = [quantity * size, unit, {unit}]
+        else:
+            total[0] += quantity * size
+            if entry and size > UNITS[total[1]][1]:
+                total[1] = unit
+            total[2].add(unit)
+
+    added = []
+    for key, (base_quantity, unit, units_seen) in totals.items():
+        if key not in ("volume", "mass", "count"):
+            added.append((base_quantity, unit))
+            continue
+        if key == "count" and len(units_seen) > 1:
+            unit = None
+        added.append((base_quantity / UNITS[unit][1], unit))
+    return added
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert an amount between units")
+    parser.add_argument("quantity", help="amount, e.g. 2 or 1/2")
+    parser.add_argument("from_unit", help="unit to convert from, e.g. cup")
+    parser.add_argument("to_unit", help="unit to convert to, e.g. ml")
+    args = parser.parse_args()
+
+    from_unit, to_unit = canonical_unit(args.from_unit), canonical_unit(args.to_unit)
+    try:
+        quantity = convert(Fraction(args.quantity), from_unit, to_unit)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{args.quantity} {from_unit} = {quantity} {to_unit} (~{float(quantity):.4g})")
+
+if __name__ == "__main__":
+    main()
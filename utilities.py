@@ -52,9 +52,13 @@ def get_dish_ingredients(dish_name):
             return dish.get('ingredients', [])
     return []
 
-def cleanup_old_ingredient_data():
-    """Remove ingredient tracking records older than 1 month"""
-    tracking_data = load_ingredient_tracking()
+def cleanup_old_ingredient_data(tracking_data=None):
+    """Remove ingredient tracking records older than 1 month
+    
+    Operates on tracking_data in place when given, otherwise on the file.
+    """
+    if tracking_data is None:
+        tracking_data = load_ingredient_tracking()
     one_month_ago = datetime.now() - timedelta(days=30)
     
     # Filter out old acquisitions
@@ -71,133 +75,32 @@ def cleanup_old_ingredient_data():
     tracking_data["ingredient_acquisitions"] = filtered_acquisitions
     save_ingredient_tracking(tracking_data)
 
-def get_upcoming_dishes():
-    """Find dishes planned for today/tomorrow with incomplete ingredients"""
+def get_upcoming_dishes(days=None):
+    """Find dishes planned in the next days (today and tomorrow by default) with incomplete ingredients
+
+    Reads the data files; inside the app use DataStore.upcoming_dishes, which
+    keeps the tracking index between calls.
+    """
+    from ingredient_tracking import TrackingIndex, upcoming_dishes
     schedule_data = load_schedule()
     tracking_data = load_ingredient_tracking()
-    
-    today = datetime.now().strftime("%Y-%m-%d")
-    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    
-    upcoming_dishes = []
-    
-    for date in [today, tomorrow]:
-        if date in schedule_data.get("schedule", {}):
-            day_schedule = schedule_data["schedule"][date]
-            for meal_type, meal_info in day_schedule.items():
-                if meal_info.get("type") == "cook":
-                    dish_name = meal_info.get("dish_name")
-                    if dish_name:
-                        # Check if this dish has incomplete ingredients
-                        has_incomplete_ingredients = True
-                        
-                        # Find tracking record for this dish/date
-                        for acquisition in tracking_data.get("ingredient_acquisitions", []):
-                            if (acquisition.get("dish_name") == dish_name and 
-                                acquisition.get("planned_cooking_date") == date):
-                                # Check if all ingredients are obtained
-                                ingredients = acquisition.get("ingredients", {})
-                                has_incomplete_ingredients = any(
-                                    not ing_info.get("obtained", False) 
-                                    for ing_info in ingredients.values()
-                                )
-                                break
-                        
-                        if has_incomplete_ingredients:
-                            upcoming_dishes.append({
-                                "dish_name": dish_name,
-                                "date": date,
-                                "meal_type": meal_type
-                            })
-    
-    return upcoming_dishes
-
-def find_leftover_chain(schedule_data, leftover_id):
-    """Find all leftover meals associated with a specific cooked dish"""
-    leftover_meals = []
-    
-    if "schedule" not in schedule_data:
-        return leftover_meals
-        
-    for date, meals in schedule_data["schedule"].items():
-        for meal_type, meal_data in meals.items():
-            if (meal_data.get("type") == "leftovers" and 
-                meal_data.get("leftover_id") == leftover_id):
-                leftover_meals.append({
-                    "date": date,
-                    "meal_type": meal_type,
-                    "meal_data": meal_data
-                })
-    
-    # Sort by date and meal type (lunch before dinner)
-    def sort_key(meal):
-        date = meal["date"]
-        meal_type_order = {"lunch": 0, "dinner": 1}
-        return (date, meal_type_order.get(meal["meal_type"], 2))
-    
-    return sorted(leftover_meals, key=sort_key)
-
-def remove_leftover_chain(schedule_data, leftover_id):
-    """Remove all leftover meals associated with a specific leftover_id"""
-    removed_count = 0
-    
-    if "schedule" not in schedule_data:
-        return removed_count
-        
-    # Find and remove all leftovers with this ID
-    dates_to_check = list(schedule_data["schedule"].keys())
-    for date in dates_to_check:
-        meal_types_to_check = list(schedule_data["schedule"][date].keys())
-        for meal_type in meal_types_to_check:
-            meal_data = schedule_data["schedule"][date][meal_type]
-            if (meal_data.get("type") == "leftovers" and 
-                meal_data.get("leftover_id") == leftover_id):
-                del schedule_data["schedule"][date][meal_type]
-                removed_count += 1
-                
-        # Clean up empty date entries
-        if not schedule_data["schedule"][date]:
-            del schedule_data["schedule"][date]
-    
-    return removed_count
+    return upcoming_dishes(schedule_data, TrackingIndex(tracking_data), days)
 
-def find_next_available_slots(schedule_data, start_date, meal_type, count):
-    """Find next available meal slots for rescheduling leftovers"""
-    available_slots = []
-    current_date = datetime.strptime(start_date, "%Y-%m-%d")
-    meal_types = ["lunch", "dinner"]
-    
-    # Start from the next meal slot
-    current_meal_index = meal_types.index(meal_type)
-    if current_meal_index < len(meal_types) - 1:
-        next_meal_type = meal_types[current_meal_index + 1]
-    else:
-        current_date += timedelta(days=1)
-        next_meal_type = meal_types[0]
-    
-    # Look for available slots within 2 weeks
-    max_date = current_date + timedelta(days=14)
-    
-    while len(available_slots) < count and current_date <= max_date:
-        date_str = current_date.strftime("%Y-%m-%d")
-        
-        # Check if slot is available
-        is_available = True
-        if "schedule" in schedule_data and date_str in schedule_data["schedule"]:
-            if next_meal_type in schedule_data["schedule"][date_str]:
-                is_available = False
-        
-        if is_available:
-            available_slots.append({
-                "date": date_str,
-                "meal_type": next_meal_type
-            })
-        
-        # Move to next slot
-        if next_meal_type == "lunch":
-            next_meal_type = "dinner"
-        else:
-            next_meal_type = "lunch"
-            current_date += timedelta(days=1)
-    
-    return available_slots
\ No newline at end of file
+def describe_meal(meal_data):
+    """Return (display_type, text) for a schedule slot, or (None, None) for an unknown meal type"""
+    if not meal_data or meal_data.get("type") == "none":
+        return "none", "No meal planned"
+    meal_kind = meal_data.get("type")
+    if meal_kind == "cook":
+        text = f"COOK: {meal_data.get('dish_name', 'Unknown dish')}"
+        leftover_count = meal_data.get("leftover_meals", 0)
+        if leftover_count > 0:
+            text += f"\n({leftover_count} leftovers)"
+        return "cook", text
+    if meal_kind == "leftovers":
+        return "leftovers", f"LEFTOVER: {meal_data.get('dish_name', 'Unknown dish')}"
+    if meal_kind == "bought":
+        return "bought", f"BOUGHT: {meal_data.get('description', 'Bought meal')}"
+    if meal_kind == "frozen":
+        return "frozen", f"FROZEN: {meal_data.get('description', 'Frozen food')}"
+    return None, None